@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import time
+import tracemalloc
+from copy import deepcopy
+from typing import Any
+
+from synthetic import make_map, walk
+
+
+def fork(soc: Any, copier: str, writes: int) -> Any:
+    forked = deepcopy(soc) if copier == "deepcopy" else soc.clone()
+    for i in range(writes):
+        forked[0].p0Group[i % 4].r0Register.value = i
+    return forked
+
+
+def main(peripherals: int = 100, registers: int = 25, writes: int = 10, forks: int = 5) -> None:
+    soc = make_map(peripherals, registers, 8, size=4)()
+    print(f"registers: {walk(soc)}")
+    for copier in ("deepcopy", "clone"):
+        samples = []
+        for _ in range(forks):
+            start = time.perf_counter()
+            fork(soc, copier, writes)
+            samples.append(time.perf_counter() - start)
+        tracemalloc.start()
+        forked = fork(soc, copier, writes)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del forked
+        print(f"{copier:<9} fork + {writes} writes: {min(samples) * 1e3:9.3f} ms, {memory / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
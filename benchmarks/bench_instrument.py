@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import timeit
+
+from synthetic import make_register
+
+import dral.model as dral
+
+
+def measure(statement: str, register: dral.Register, number: int) -> float:
+    timer = timeit.Timer(statement, globals={"register": register})
+    return min(timer.repeat(number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 100000) -> None:
+    plain = make_register("Plain", 0x0, 8)()
+    instrumented = make_register("Instrumented", 0x4, 8)()
+    backend = dral.MemoryBackend()
+    plain.attach(backend)
+    instrumented.attach(backend)
+    profiler = dral.Profiler()
+    profiler.instrument(instrumented)
+
+    print(f"{'op':<10} {'plain ns':>10} {'profiled ns':>12} {'overhead':>9}")
+    for op, statement in (("get", "register.value"), ("set", "register.value = 0x5A5A5A5A"), ("field set", "register.f0Field.value = 1")):
+        before = measure(statement, plain, number)
+        after = measure(statement, instrumented, number)
+        print(f"{op:<10} {before:>10.1f} {after:>12.1f} {after - before:>8.1f}ns")
+
+
+if __name__ == "__main__":
+    main()
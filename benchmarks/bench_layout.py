@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import time
+from importlib import import_module
+from pathlib import Path
+
+from synthetic import render_module
+
+import dral.model as dral
+
+
+def main(peripherals: int = 200, registers: int = 25, fields: int = 8, size: int = 4) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory)
+        (path / "soc_regs.py").write_text(render_module(peripherals, registers, fields, size))
+        sys.path.insert(0, directory)
+        try:
+            dral.load_layout("soc_regs", path / "cache").close()
+            sys.modules.pop("soc_regs")
+
+            start = time.perf_counter()
+            import_module("soc_regs")
+            imported = time.perf_counter()
+            sys.modules.pop("soc_regs")
+
+            loading = time.perf_counter()
+            with dral.load_layout("soc_regs", path / "cache") as cache:
+                opened = time.perf_counter()
+                cache["P0Group"]
+                single = time.perf_counter()
+                for name in cache:
+                    cache[name]
+                loaded = time.perf_counter()
+        finally:
+            sys.path.remove(directory)
+
+    print(f"groups:          {peripherals}")
+    print(f"import:          {(imported - start) * 1e3:9.2f} ms")
+    print(f"cache open:      {(opened - loading) * 1e3:9.2f} ms")
+    print(f"cache one group: {(single - opened) * 1e3:9.2f} ms")
+    print(f"cache all:       {(loaded - opened) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
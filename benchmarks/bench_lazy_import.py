@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synthetic import render_module
+
+ROOT = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import time
+start = time.perf_counter()
+import {package}
+imported = time.perf_counter()
+{package}.P0Group()
+accessed = time.perf_counter()
+names = dir({package})
+listed = time.perf_counter()
+print(imported - start, accessed - imported, listed - accessed, len([x for x in names if x.endswith("Group")]))
+"""
+
+
+def render_package(path: Path, peripherals: int, registers: int, fields: int, lazy: bool) -> None:
+    path.mkdir()
+    for p in range(peripherals):
+        (path / f"p{p}.py").write_text(render_module(1, registers, fields, first=p, address=0x40000000 + (p * 0x10000)))
+    if lazy:
+        exports = "".join(f'        "P{p}Group": ".p{p}",\n' for p in range(peripherals))
+        source = f"import dral.model as dral\n\n__all__ = dral.lazy_package(\n    __name__,\n    {{\n{exports}    }},\n)\n"
+    else:
+        source = "".join(f"from .p{p} import P{p}Group as P{p}Group\n" for p in range(peripherals))
+    (path / "__init__.py").write_text(source)
+
+
+def probe(directory: str, package: str) -> list[float]:
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join([directory, str(ROOT)])}
+    command = [sys.executable, "-c", PROBE.format(package=package)]
+    output = subprocess.run(command, env=environment, capture_output=True, text=True, check=True)
+    return [float(x) for x in output.stdout.split()]
+
+
+def main(peripherals: int = 500, registers: int = 25, fields: int = 8, runs: int = 3) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for package, lazy in (("eager_soc", False), ("lazy_soc", True)):
+            render_package(Path(directory) / package, peripherals, registers, fields, lazy)
+            probe(directory, package)
+            results = min((probe(directory, package) for _ in range(runs)), key=lambda x: x[0])
+            imported, accessed, listed, count = results
+            print(f"{package}:")
+            print(f"  import:       {imported * 1e3:9.2f} ms")
+            print(f"  first access: {accessed * 1e3:9.2f} ms")
+            print(f"  list groups:  {listed * 1e3:9.2f} ms ({int(count)} groups)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from copy import deepcopy
+
+from legacy import make_register
+from synthetic import make_map, walk
+
+
+def per_register(count: int, fields: int, legacy: bool) -> float:
+    template = make_register(fields, legacy)
+    gc.collect()
+    tracemalloc.start()
+    registers = [deepcopy(template) for _ in range(count)]
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del registers
+    return memory / count
+
+
+def main(peripherals: int = 100, registers: int = 25, fields: int = 8, size: int = 4) -> None:
+    soc_type = make_map(peripherals, registers, fields, size)
+    gc.collect()
+    tracemalloc.start()
+    soc = soc_type()
+    count = walk(soc)
+    gc.collect()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"registers:          {count}")
+    print(f"fields/register:    {fields}")
+    print(f"materialized bytes: {memory}")
+    print(f"bytes/register:     {memory / count:9.1f}")
+    print()
+    print(f"{'fields':>6} {'legacy B/reg':>13} {'current B/reg':>14}")
+    for width in (1, 8, 32):
+        print(f"{width:>6} {per_register(count, width, True):>13.1f} {per_register(count, width, False):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
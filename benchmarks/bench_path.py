@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+
+from synthetic import make_map
+
+
+def measure(operation: Callable[[], object], number: int) -> float:
+    return min(timeit.repeat(operation, number=number, repeat=5)) / number * 1e9
+
+
+def main(peripherals: int = 100, registers: int = 25, number: int = 100000) -> None:
+    soc = make_map(peripherals, registers, 8, size=4)()
+    path = "Soc.P50[3].R12.F3"
+    pattern = "Soc.P*[*].R12.F3"
+
+    def uncached(operation: Callable[[], object]) -> Callable[[], object]:
+        def run() -> object:
+            soc._paths().clear()
+            return operation()
+
+        return run
+
+    print(f"matches for {pattern}: {len(soc.glob(pattern))}")
+    print(f"attribute chain:  {measure(lambda: soc.p50Group[3].r12Register.f3Field, number):10.1f} ns")
+    print(f"lookup (cached):  {measure(lambda: soc.lookup(path), number):10.1f} ns")
+    print(f"lookup (parsed):  {measure(uncached(lambda: soc.lookup(path)), number // 10):10.1f} ns")
+    print(f"glob (cached):    {measure(lambda: soc.glob(pattern), number // 100):10.1f} ns")
+    print(f"glob (parsed):    {measure(uncached(lambda: soc.glob(pattern)), 10):10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
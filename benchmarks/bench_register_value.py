@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import timeit
+from typing import Any
+
+from legacy import make_register
+
+OPERATIONS = (
+    ("get", "register.value"),
+    ("set", "register.value = 0x5A5A5A5A"),
+    ("fget", "register.f0Field.value"),
+    ("fset", "register.f0Field.value = 1"),
+)
+
+
+def measure(statement: str, register: Any, number: int) -> float:
+    timer = timeit.Timer(statement, globals={"register": register})
+    return min(timer.repeat(number=number, repeat=5)) / number * 1e9
+
+
+def main(number: int = 100000) -> None:
+    print(f"{'fields':>6} {'op':>4} {'legacy ns':>10} {'current ns':>11} {'speedup':>8}")
+    for count in (1, 8, 32):
+        legacy = make_register(count, legacy=True)
+        current = make_register(count)
+        for op, statement in OPERATIONS:
+            before = measure(statement, legacy, number)
+            after = measure(statement, current, number)
+            print(f"{count:>6} {op:>4} {before:>10.1f} {after:>11.1f} {before / after:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import dral.model as dral
+
+
+def measure(operation: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    operation()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main(count: int = 2000) -> None:
+    addresses = [0x20000000 + (i * 4) for i in range(count)]
+    with dral.RemoteServer(dral.MemoryBackend()) as server:
+        with dral.RemoteBackend(*server.address, posted=False) as backend:
+            sequential_write = measure(lambda: [backend.write(address, i) for i, address in enumerate(addresses)], count)
+            sequential_read = measure(lambda: [backend.read(address) for address in addresses], count)
+        with dral.RemoteBackend(*server.address) as backend:
+            posted_write = measure(lambda: ([backend.write(address, i) for i, address in enumerate(addresses)], backend.sync()), count)
+            pipelined_read = measure(lambda: backend.read_many(addresses), count)
+            block_read = measure(lambda: backend.read_block(addresses[0], count), count)
+
+    print(f"{'operation':<20} {'us/register':>12}")
+    print(f"{'write (round-trip)':<20} {sequential_write:>12.2f}")
+    print(f"{'write (posted)':<20} {posted_write:>12.2f}")
+    print(f"{'read (round-trip)':<20} {sequential_read:>12.2f}")
+    print(f"{'read (pipelined)':<20} {pipelined_read:>12.2f}")
+    print(f"{'read (block)':<20} {block_read:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from copy import deepcopy
+
+from synthetic import make_map
+
+import dral.model as dral
+
+
+def measure(operation: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        operation()
+    return (time.perf_counter() - start) / count * 1e3
+
+
+def main(peripherals: int = 100, registers: int = 25, count: int = 20) -> None:
+    soc = make_map(peripherals, registers, 8, size=4)()
+    soc.attach(dral.MemoryBackend())
+    before = soc.snapshot()
+    members = soc._registers()
+    for register in members[:: len(members) // 10]:
+        register.value = 1
+    after = soc.snapshot()
+
+    print(f"registers:        {len(before)}")
+    print(f"snapshot:         {measure(soc.snapshot, count):9.3f} ms")
+    print(f"diff (10 changed):{measure(lambda: before.diff(after), count):9.3f} ms")
+    print(f"diff (identical): {measure(lambda: before.diff(before), count):9.3f} ms")
+    print(f"restore:          {measure(lambda: soc.restore(before), count):9.3f} ms")
+    print(f"deepcopy:         {measure(lambda: deepcopy(soc), 1):9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
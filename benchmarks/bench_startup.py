@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import time
+
+from synthetic import make_map, walk
+
+
+def main(peripherals: int = 100, registers: int = 25, fields: int = 8, size: int = 4) -> None:
+    start = time.perf_counter()
+    soc_type = make_map(peripherals, registers, fields, size)
+    decorated = time.perf_counter()
+    soc = soc_type()
+    instantiated = time.perf_counter()
+    count = walk(soc)
+    walked = time.perf_counter()
+
+    print(f"registers:      {count}")
+    print(f"decoration:     {(decorated - start) * 1e3:9.2f} ms")
+    print(f"instantiation:  {(instantiated - decorated) * 1e3:9.2f} ms")
+    print(f"materialization:{(walked - instantiated) * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import make_map
+
+import dral.model as dral
+
+
+def main(peripherals: int = 20, registers: int = 25, rounds: int = 20) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bus.trace"
+        soc = make_map(peripherals, registers, 8, size=4)()
+        soc.read_all()
+        writes = [(register, i) for i, register in enumerate(soc._registers())]
+
+        soc.attach(dral.MemoryBackend())
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for register, value in writes:
+                register.value = value
+        plain = time.perf_counter() - start
+
+        with dral.TraceRecorder(dral.MemoryBackend(), path) as recorder:
+            recorder.track(soc)
+            soc.attach(recorder)
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for register, value in writes:
+                    register.value = value
+            traced = time.perf_counter() - start
+
+        with dral.TraceReader(path) as reader:
+            start = time.perf_counter()
+            count = sum(1 for _ in reader)
+            scanned = time.perf_counter() - start
+
+    accesses = rounds * len(writes)
+    print(f"accesses:       {accesses}")
+    print(f"plain write:    {plain / accesses * 1e9:9.1f} ns")
+    print(f"traced write:   {traced / accesses * 1e9:9.1f} ns")
+    print(f"records read:   {count}")
+    print(f"read record:    {scanned / count * 1e9:9.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from copy import copy, deepcopy
+from inspect import getmembers
+from typing import Any, TypeVar
+
+import dral.model as dral
+
+# Reference copy of the original Field/Register layout: every register instance owns deep-copied
+# Field objects holding their own value, and Register.value packs/unpacks them one at a time.
+
+
+class Field:
+    def __init__(self, name: str, position: int, width: int) -> None:
+        self._name = name
+        self._position = position
+        self._width = width
+        self._mask = (1 << width) - 1
+        self._value = 0
+
+    @property
+    def position(self) -> int:
+        return self._position
+
+    @property
+    def mask(self) -> int:
+        return self._mask
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value & self._mask
+
+
+class Register:
+    def __init__(self) -> None:
+        self._name: str = ""
+        self._address: int = 0
+        self._access: dral.AccessType = dral.AccessType.ReadWrite
+        self._value: int = 0
+        self._fields: tuple[Field, ...] = self._get_all_fields()
+
+    def _get_all_fields(self) -> tuple[Field, ...]:
+        field_members = getmembers(self, lambda x: isinstance(x, Field))
+        fields = [x[1] for x in field_members if x[0].startswith("_")]
+        return tuple(sorted(fields, key=lambda x: x.position))
+
+    def _clear_value(self) -> None:
+        for field in self._fields:
+            self._value &= ~(field.mask << field.position)
+
+    def _set_value(self) -> None:
+        self._clear_value()
+        for field in self._fields:
+            self._value |= (field.value & field.mask) << field.position
+
+    def _update_fields(self) -> None:
+        for field in self._fields:
+            field.value = (self._value >> field.position) & field.mask
+
+    @property
+    def value(self) -> int:
+        self._set_value()
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+        self._update_fields()
+
+
+RegisterInstanceType = TypeVar("RegisterInstanceType", bound=Register)
+RegisterType = TypeVar("RegisterType", bound=type)
+
+
+def _setup_fields(cls: RegisterType) -> RegisterType:
+    fields = {attr: value for attr, value in cls.__dict__.items() if isinstance(value, Field)}
+    for attr, field in fields.items():
+        setattr(cls, f"_{attr}", field)
+
+    for attr, _ in fields.items():
+
+        def getter(self: RegisterType, attr: str = attr) -> Any:
+            return getattr(self, f"_{attr}")
+
+        def setter(self: RegisterType, value: Any, attr: str = attr) -> None:
+            raise AttributeError(f"Cannot set value directly on {attr}. Use {attr}.value = <value> instead.")
+
+        setattr(cls, attr, property(getter, setter))
+
+    return cls
+
+
+def _deepcopy(self: RegisterInstanceType, memo: dict[int, Any]) -> RegisterInstanceType:
+    instance = copy(self)
+    memo[id(self)] = instance
+    fields = [x for x in getmembers(instance, lambda x: isinstance(x, Field)) if x[0].startswith("_")]
+    for attr, field in fields:
+        setattr(instance, attr, deepcopy(field, memo))
+    instance._fields = instance._get_all_fields()
+    return instance
+
+
+def _setup_init(cls: RegisterType, name: str, address: int) -> RegisterType:
+    init = getattr(cls, "__init__", None)
+    fields = getmembers(cls, lambda x: isinstance(x, Field))
+
+    def __init__(self: RegisterType) -> None:
+        if init is not None:
+            init(self)
+        self._name = name  # type: ignore[attr-defined]
+        self._address = address  # type: ignore[attr-defined]
+        for attr, value in fields:
+            setattr(self, attr, deepcopy(value))
+
+    cls.__init__ = __init__  # type: ignore[misc]
+    return cls
+
+
+def register(name: str, address: int) -> Callable[[RegisterType], RegisterType]:
+    def decorator(cls: RegisterType) -> RegisterType:
+        cls.__deepcopy__ = _deepcopy  # type: ignore[attr-defined]
+        cls = _setup_fields(cls)
+        cls = _setup_init(cls, name, address)
+        return cls
+
+    return decorator
+
+
+def make_register(count: int, legacy: bool = False) -> Any:
+    width = 32 // count
+    field, base, decorate = (Field, Register, register) if legacy else (dral.Field, dral.Register, dral.register)
+    fields = {f"f{i}Field": field(f"F{i}", i * width, width) for i in range(count)}
+    return decorate(f"Bench{count}", 0x00000000)(type(f"Bench{count}Register", (base,), fields))()
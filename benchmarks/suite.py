@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+from synthetic import make_map, walk
+
+import dral.model as dral
+
+Benchmark = Callable[[], Any]
+
+
+def measure(operation: Benchmark, number: int, repeat: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            operation()
+        samples.append((time.perf_counter_ns() - start) / number)
+    return {"median": statistics.median(samples), "min": min(samples), "number": number, "repeat": repeat}
+
+
+def benchmarks(args: argparse.Namespace) -> dict[str, tuple[Benchmark, int]]:
+    shape = (args.peripherals, args.registers, args.fields, args.size)
+    soc_type = make_map(*shape, depth=args.depth)
+    soc = soc_type()
+    count = walk(soc)
+    entries = sorted(soc._walk(), key=lambda x: x[1])
+    path, address, _ = entries[len(entries) // 2]
+    register = soc._resolve(path)
+    peripheral = soc.p0Group
+    index = dral.AddressIndex(soc)
+    print(f"map: {count} registers, {len(entries)} addresses", file=sys.stderr)
+
+    def materialize() -> None:
+        walk(soc_type())
+
+    def field_get() -> int:
+        return register.f0Field.value  # type: ignore[no-any-return]
+
+    def field_set() -> None:
+        register.f0Field.value = 1
+
+    def register_set() -> None:
+        register.value = 0x5A5A5A5A
+
+    return {
+        "decorate": (lambda: make_map(*shape, depth=args.depth), 1),
+        "instantiate": (soc_type, 1000),
+        "materialize": (materialize, 1),
+        "register_get": (lambda: register.value, args.number),
+        "register_set": (register_set, args.number),
+        "field_get": (field_get, args.number),
+        "field_set": (field_set, args.number),
+        "group_getitem": (lambda: peripheral[len(peripheral) - 1], args.number),
+        "resolve": (lambda: soc._resolve(path), args.number),
+        "walk": (lambda: sum(1 for _ in soc._walk()), 1),
+        "address_map": (soc_type.address_map, 1),
+        "index_build": (lambda: dral.AddressIndex(soc), 1),
+        "index_lookup": (lambda: index[address], args.number),
+        "deepcopy_register": (lambda: deepcopy(register), args.number // 10),
+        "deepcopy_group": (lambda: deepcopy(peripheral), 10),
+    }
+
+
+def revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    print(f"{'benchmark':<18} {'baseline ns':>14} {'current ns':>14} {'ratio':>7}")
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        print(f"{name:<18} {before['median']:>14.1f} {result['median']:>14.1f} {result['median'] / before['median']:>6.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the dral.model benchmark suite")
+    parser.add_argument("--peripherals", type=int, default=50)
+    parser.add_argument("--registers", type=int, default=25)
+    parser.add_argument("--fields", type=int, default=8)
+    parser.add_argument("--size", type=int, default=4)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--number", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    args = parser.parse_args()
+
+    results: dict[str, Any] = {
+        "meta": {
+            "revision": revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.time(),
+        },
+        "params": {key: value for key, value in vars(args).items() if key not in ("output", "compare", "filter")},
+        "results": {},
+    }
+    for name, (operation, number) in benchmarks(args).items():
+        if args.filter in name:
+            results["results"][name] = measure(operation, max(number, 1), args.repeat)
+            print(f"{name:<18} {results['results'][name]['median']:>14.1f} ns", file=sys.stderr)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare is not None:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
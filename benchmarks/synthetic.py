@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any
+
+import dral.model as dral
+
+
+def make_register(name: str, address: int, fields: int) -> type[dral.Register]:
+    width = max(32 // fields, 1)
+    members = {f"f{i}Field": dral.Field(f"F{i}", i * width, width) for i in range(fields)}
+    return dral.register(name, address)(type(f"{name}Register", (dral.Register,), members))
+
+
+def span(registers: int, size: int = 1, depth: int = 0) -> int:
+    if depth == 0:
+        return registers * 4
+    return (registers * 4) + (size * span(registers, size, depth - 1))
+
+
+def make_group(
+    name: str, address: int, registers: int, fields: int, size: int = 1, stride: int = 0x1000, depth: int = 0
+) -> type[dral.Group]:
+    members: dict[str, Any] = {}
+    for i in range(registers):
+        members[f"r{i}Register"] = make_register(f"R{i}", i * 4, fields)()
+    if depth > 0:
+        nested = span(registers, size, depth - 1)
+        members["nGroup"] = make_group(f"{name}N", registers * 4, registers, fields, size, nested, depth - 1)()
+    return dral.group(name, address, stride if size > 1 else 0, size)(type(f"{name}Group", (dral.Group,), members))
+
+
+def make_map(peripherals: int, registers: int, fields: int, size: int = 1, address: int = 0x40000000, depth: int = 0) -> type[dral.Group]:
+    stride = max(span(registers, size, depth), 0x1000)
+    members: dict[str, Any] = {}
+    for i in range(peripherals):
+        members[f"p{i}Group"] = make_group(f"P{i}", i * stride * size, registers, fields, size, stride, depth)()
+    return dral.group("Soc", address, 0, 1)(type("SocGroup", (dral.Group,), members))
+
+
+def walk(group: dral.Group) -> int:
+    count = 0
+    for i in range(len(group)):
+        for attr, template in group._children.items():
+            child = getattr(group[i], attr)
+            count += walk(child) if isinstance(template, dral.Group) else 1
+    return count
+
+
+def render_module(peripherals: int, registers: int, fields: int, size: int = 1, address: int = 0x40000000, first: int = 0) -> str:
+    width = max(32 // fields, 1)
+    stride = max(registers * 4, 0x1000)
+    lines = ["import dral.model as dral", ""]
+    for p in range(first, first + peripherals):
+        decorator = f'@dral.group("P{p}", {address + (p * stride * size):#010x}, {stride if size > 1 else 0:#x}, {size})'
+        lines += ["", decorator, f"class P{p}Group(dral.Group):"]
+        for r in range(registers):
+            lines += [f'    @dral.register("R{r}", {r * 4:#x}, dral.AccessType.ReadWrite)', f"    class R{r}Register(dral.Register):"]
+            lines += [f'        f{i}Field = dral.Field("F{i}", {i * width}, {width})' for i in range(fields)]
+            lines += [""]
+        lines += [f"    r{r}Register = R{r}Register()" for r in range(registers)]
+        lines += [""]
+    return "\n".join(lines)
@@ -1,6 +1,46 @@
 from .access import AccessType as AccessType
+from .backend import AsyncBackend as AsyncBackend
+from .backend import AsyncMemoryBackend as AsyncMemoryBackend
+from .backend import Backend as Backend
+from .backend import MemoryBackend as MemoryBackend
+from .backend import MmapBackend as MmapBackend
+from .cache import ShadowCache as ShadowCache
+from .columnar import ColumnarCodec as ColumnarCodec
+from .field import BoundField as BoundField
 from .field import Field as Field
 from .group import Group as Group
+from .group import GroupView as GroupView
 from .group import group as group
+from .index import AddressIndex as AddressIndex
+from .instrument import AccessStats as AccessStats
+from .instrument import Profiler as Profiler
+from .layout import LayoutCache as LayoutCache
+from .layout import LayoutError as LayoutError
+from .layout import dump_layout as dump_layout
+from .layout import load_layout as load_layout
+from .lazy import lazy_package as lazy_package
+from .path import PathResolver as PathResolver
+from .poll import Backoff as Backoff
+from .poll import WaitResult as WaitResult
+from .poll import WaitTimeout as WaitTimeout
+from .poll import wait_for as wait_for
 from .register import Register as Register
 from .register import register as register
+from .remote import RemoteBackend as RemoteBackend
+from .remote import RemoteError as RemoteError
+from .remote import RemoteServer as RemoteServer
+from .snapshot import Change as Change
+from .snapshot import Snapshot as Snapshot
+from .svd import iter_json as iter_json
+from .svd import iter_svd as iter_svd
+from .svd import load_json as load_json
+from .svd import load_svd as load_svd
+from .sweep import SweepResult as SweepResult
+from .sweep import check_access as check_access
+from .sweep import check_reset as check_reset
+from .sweep import check_walking_ones as check_walking_ones
+from .sweep import sweep as sweep
+from .trace import TraceReader as TraceReader
+from .trace import TraceRecord as TraceRecord
+from .trace import TraceRecorder as TraceRecorder
+from .transaction import Transaction as Transaction
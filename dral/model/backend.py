@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from .register import Register
+
+
+class Backend(ABC):
+    _width: int = 4
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @abstractmethod
+    def read(self, address: int) -> int: ...
+
+    @abstractmethod
+    def write(self, address: int, value: int) -> None: ...
+
+    def read_block(self, address: int, count: int) -> list[int]:
+        return [self.read(address + (i * self._width)) for i in range(count)]
+
+    def write_block(self, address: int, values: Sequence[int]) -> None:
+        for i, value in enumerate(values):
+            self.write(address + (i * self._width), value)
+
+    def read_many(self, addresses: Sequence[int]) -> list[int]:
+        return [self.read(address) for address in addresses]
+
+    def bind(self, register: Register) -> None:
+        return None
+
+    def invalidate(self, addresses: Iterable[int] | None = None) -> None:
+        return None
+
+    def flush(self, addresses: Iterable[int] | None = None) -> None:
+        return None
+
+
+class AsyncBackend(ABC):
+    _width: int = 4
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @abstractmethod
+    async def aread(self, address: int) -> int: ...
+
+    @abstractmethod
+    async def awrite(self, address: int, value: int) -> None: ...
+
+    async def aread_block(self, address: int, count: int) -> list[int]:
+        return [await self.aread(address + (i * self._width)) for i in range(count)]
+
+    async def awrite_block(self, address: int, values: Sequence[int]) -> None:
+        for i, value in enumerate(values):
+            await self.awrite(address + (i * self._width), value)
+
+
+class MemoryBackend(Backend):
+    def __init__(self, memory: dict[int, int] | None = None) -> None:
+        self._memory: dict[int, int] = {} if memory is None else memory
+
+    @property
+    def memory(self) -> dict[int, int]:
+        return self._memory
+
+    def read(self, address: int) -> int:
+        return self._memory.get(address, 0)
+
+    def write(self, address: int, value: int) -> None:
+        self._memory[address] = value
+
+
+class AsyncMemoryBackend(AsyncBackend):
+    def __init__(self, memory: dict[int, int] | None = None, latency: float = 0.0) -> None:
+        self._memory: dict[int, int] = {} if memory is None else memory
+        self._latency = latency
+
+    @property
+    def memory(self) -> dict[int, int]:
+        return self._memory
+
+    async def aread(self, address: int) -> int:
+        await asyncio.sleep(self._latency)
+        return self._memory.get(address, 0)
+
+    async def awrite(self, address: int, value: int) -> None:
+        await asyncio.sleep(self._latency)
+        self._memory[address] = value
+
+    async def aread_block(self, address: int, count: int) -> list[int]:
+        await asyncio.sleep(self._latency)
+        return [self._memory.get(address + (i * self._width), 0) for i in range(count)]
+
+    async def awrite_block(self, address: int, values: Sequence[int]) -> None:
+        await asyncio.sleep(self._latency)
+        for i, value in enumerate(values):
+            self._memory[address + (i * self._width)] = value
+
+
+class MmapBackend(Backend):
+    _formats = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+    def __init__(
+        self,
+        path: str | Path,
+        base: int = 0,
+        size: int = 0,
+        offset: int = 0,
+        width: int = 4,
+        byteorder: Literal["little", "big"] = "little",
+    ) -> None:
+        if width not in self._formats:
+            raise ValueError(f"Unsupported register width {width}, expected one of {sorted(self._formats)}")
+        self._base = base
+        self._width = width
+        self._struct = Struct(("<" if byteorder == "little" else ">") + self._formats[width])
+        self._blocks: dict[int, Struct] = {}
+        fd = os.open(path, os.O_RDWR | getattr(os, "O_SYNC", 0))
+        try:
+            self._mmap = mmap.mmap(fd, size, offset=offset)
+        finally:
+            os.close(fd)
+        self._memory = memoryview(self._mmap)
+        self._size = len(self._memory)
+
+    def __enter__(self) -> MmapBackend:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    @property
+    def base(self) -> int:
+        return self._base
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _offset(self, address: int, count: int = 1) -> int:
+        offset = address - self._base
+        if offset < 0 or offset + (count * self._width) > self._size:
+            raise IndexError(f"Address {address:#010x} outside of mapped range {self._base:#010x}-{self._base + self._size:#010x}")
+        return offset
+
+    def read(self, address: int) -> int:
+        return self._struct.unpack_from(self._memory, self._offset(address))[0]  # type: ignore[no-any-return]
+
+    def write(self, address: int, value: int) -> None:
+        self._struct.pack_into(self._memory, self._offset(address), value)
+
+    def _block(self, count: int) -> Struct:
+        block = self._blocks.get(count)
+        if block is None:
+            block = self._blocks[count] = Struct(f"{self._struct.format[0]}{count}{self._struct.format[1:]}")
+        return block
+
+    def read_block(self, address: int, count: int) -> list[int]:
+        return list(self._block(count).unpack_from(self._memory, self._offset(address, count)))
+
+    def write_block(self, address: int, values: Sequence[int]) -> None:
+        self._block(len(values)).pack_into(self._memory, self._offset(address, len(values)), *values)
+
+    def flush(self, addresses: Iterable[int] | None = None) -> None:
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self._memory.release()
+        self._mmap.close()
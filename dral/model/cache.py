@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .access import AccessType
+from .backend import Backend
+from .group import Group
+from .register import Register
+
+
+class ShadowCache(Backend):
+    def __init__(self, backend: Backend, volatile: bool = True, write_back: bool = False) -> None:
+        self._backend = backend
+        self._width = backend.width
+        self._volatile = volatile
+        self._write_back = write_back
+        self._access: dict[int, AccessType] = {}
+        self._cache: dict[int, int] = {}
+        self._written: dict[int, int] = {}
+        self._dirty: dict[int, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def backend(self) -> Backend:
+        return self._backend
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def dirty(self) -> list[int]:
+        return sorted(self._dirty)
+
+    def reset_stats(self) -> None:
+        self._hits = 0
+        self._misses = 0
+
+    def track(self, target: Register | Group) -> None:
+        if isinstance(target, Group):
+            for _, address, template in target._walk():
+                self._access[address] = template.access
+        else:
+            self._access[target.address] = target.access
+
+    def bind(self, register: Register) -> None:
+        self._access[register.address] = register.access
+        self._backend.bind(register)
+
+    def _cacheable(self, access: AccessType) -> bool:
+        return access == AccessType.ReadWrite or (access == AccessType.ReadOnly and not self._volatile)
+
+    def read(self, address: int) -> int:
+        access = self._access.get(address, AccessType.ReadWrite)
+        if access == AccessType.WriteOnly:
+            self._hits += 1
+            return self._written.get(address, 0)
+        if not self._cacheable(access):
+            self._misses += 1
+            return self._backend.read(address)
+        value = self._cache.get(address)
+        if value is None:
+            self._misses += 1
+            value = self._cache[address] = self._backend.read(address)
+        else:
+            self._hits += 1
+        return value
+
+    def write(self, address: int, value: int) -> None:
+        access = self._access.get(address, AccessType.ReadWrite)
+        if access == AccessType.WriteOnly:
+            self._written[address] = value
+        elif self._cacheable(access):
+            self._cache[address] = value
+        if self._write_back:
+            self._dirty[address] = value
+        else:
+            self._backend.write(address, value)
+
+    def invalidate(self, addresses: Iterable[int] | None = None) -> None:
+        if addresses is None:
+            self._cache = {address: value for address, value in self._cache.items() if address in self._dirty}
+        else:
+            for address in addresses:
+                if address not in self._dirty:
+                    self._cache.pop(address, None)
+        self._backend.invalidate(addresses)
+
+    def flush(self, addresses: Iterable[int] | None = None) -> None:
+        pending = sorted(self._dirty) if addresses is None else sorted(x for x in addresses if x in self._dirty)
+        for address in pending:
+            self._backend.write(address, self._dirty.pop(address))
+        self._backend.flush(addresses)
+
+    def reapply(self, addresses: Iterable[int] | None = None) -> None:
+        pending = sorted(self._written) if addresses is None else sorted(x for x in addresses if x in self._written)
+        for address in pending:
+            self._backend.write(address, self._written[address])
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from .register import Register
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike, NDArray
+else:
+    np = None
+
+
+def _import_numpy() -> None:
+    global np
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError as error:  # pragma: no cover
+        raise ImportError("NumPy is required for columnar decoding, install it with: pip install dral-model[numpy]") from error
+    np = numpy
+
+
+def _dtype(width: int) -> Any:
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if width <= np.iinfo(dtype).bits:
+            return dtype
+    return np.uint64
+
+
+class ColumnarCodec:
+    def __init__(self, register: type[Register] | Register) -> None:
+        _import_numpy()
+        register_type = register if isinstance(register, type) else type(register)
+        self._fields = tuple((attr.removeprefix("_"), getattr(register_type, attr)) for attr in register_type._layout)
+        self._names = tuple(name for name, _ in self._fields)
+        self._dtype = np.dtype([(name, _dtype(field.width)) for name, field in self._fields])
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return self._names
+
+    @property
+    def dtype(self) -> Any:
+        return self._dtype
+
+    def decode(self, values: ArrayLike) -> dict[str, NDArray[Any]]:
+        raw = np.asarray(values).astype(np.uint64, copy=False)
+        return {
+            name: ((raw >> np.uint64(field.position)) & np.uint64(field.mask)).astype(_dtype(field.width)) for name, field in self._fields
+        }
+
+    def decode_structured(self, values: ArrayLike) -> NDArray[Any]:
+        raw = np.asarray(values).astype(np.uint64, copy=False)
+        records = np.empty(raw.shape, dtype=self._dtype)
+        for name, field in self._fields:
+            records[name] = (raw >> np.uint64(field.position)) & np.uint64(field.mask)
+        return records
+
+    def encode(self, columns: Mapping[str, ArrayLike] | NDArray[Any], base: ArrayLike = 0, dtype: Any = None) -> NDArray[Any]:
+        names = columns.dtype.names if isinstance(columns, np.ndarray) else tuple(columns)
+        unknown = set(names or ()) - set(self._names)
+        if unknown:
+            raise KeyError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        raw = np.array(base, dtype=np.uint64)
+        for name, field in self._fields:
+            if name not in (names or ()):
+                continue
+            column = np.asarray(columns[name]).astype(np.uint64, copy=False)
+            mask = np.uint64(field.mask << field.position)
+            raw = (raw & ~mask) | ((column << np.uint64(field.position)) & mask)
+        return raw.astype(np.uint32 if dtype is None else dtype)
@@ -1,17 +1,67 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any, overload
+
+from .poll import Backoff, Predicate, WaitResult, wait_for
+
+if TYPE_CHECKING:
+    from .register import Register
+
+_new = object.__new__
+
 
 class Field:
+    __slots__ = ("_name", "_position", "_width", "_mask", "_attr")
+
+    _name: str
+    _position: int
+    _width: int
+    _mask: int
+    _attr: str
+
     def __init__(self, name: str, position: int, width: int) -> None:
-        self._name = name
-        self._position = position
-        self._width = width
-        self._mask = (1 << width) - 1
-        self._value = 0
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_position", position)
+        object.__setattr__(self, "_width", width)
+        object.__setattr__(self, "_mask", (1 << width) - 1)
+        object.__setattr__(self, "_attr", name)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        raise AttributeError(f"Cannot set attribute {attr} on field {self._name}")
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        if not attr.startswith("_"):
+            object.__setattr__(self, "_attr", attr)
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Field: ...
+
+    @overload
+    def __get__(self, instance: Register, owner: type | None = None) -> BoundField: ...
+
+    def __get__(self, instance: Register | None, owner: type | None = None) -> Field | BoundField:
+        if instance is None:
+            return self
+        bound = _new(BoundField)
+        bound._register = instance
+        bound._field = self
+        return bound
+
+    def __set__(self, instance: Register, value: Any) -> None:
+        raise AttributeError(f"Cannot set value directly on {self._attr}. Use {self._attr}.value = <value> instead.")
 
     def __str__(self) -> str:
         return self._name
 
+    def __copy__(self) -> Field:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Field:
+        return self
+
+    def __reduce__(self) -> tuple[type[Field], tuple[str, int, int]]:
+        return type(self), (self._name, self._position, self._width)
+
     @property
     def name(self) -> str:
         return self._name
@@ -28,10 +78,71 @@ class Field:
     def width(self) -> int:
         return self._width
 
+
+class BoundField:
+    __slots__ = ("_register", "_field")
+
+    def __init__(self, register: Register, field: Field) -> None:
+        self._register = register
+        self._field = field
+
+    def __str__(self) -> str:
+        return self._field._name
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BoundField):
+            return NotImplemented
+        return self._register is other._register and self._field is other._field
+
+    def __hash__(self) -> int:
+        return hash((id(self._register), self._field))
+
+    def wait_until(self, predicate: Predicate, timeout: float | None = 1.0, backoff: Backoff | None = None) -> WaitResult:
+        return wait_for(((self, predicate),), timeout, backoff)
+
+    @property
+    def field(self) -> Field:
+        return self._field
+
+    @property
+    def register(self) -> Register:
+        return self._register
+
+    @property
+    def name(self) -> str:
+        return self._field._name
+
+    @property
+    def position(self) -> int:
+        return self._field._position
+
+    @property
+    def mask(self) -> int:
+        return self._field._mask
+
+    @property
+    def width(self) -> int:
+        return self._field._width
+
+    @property
+    def _value(self) -> int:
+        field = self._field
+        return (self._register._value >> field._position) & field._mask
+
     @property
     def value(self) -> int:
-        return self._value
+        register = self._register
+        if register._backend is not None:
+            register._load()
+        field = self._field
+        return (register._value >> field._position) & field._mask
 
     @value.setter
     def value(self, value: int) -> None:
-        self._value = value & self._mask
+        register = self._register
+        field = self._field
+        if register._backend is not None:
+            register._write_field(field, value)
+            return
+        mask = field._mask << field._position
+        register._value = (register._value & ~mask) | ((value << field._position) & mask)
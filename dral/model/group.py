@@ -1,23 +1,83 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+from array import array
+from collections.abc import Callable, Iterator
 from copy import copy, deepcopy
-from inspect import getmembers
 from typing import Any, TypeVar
 
+from .access import AccessType
+from .backend import AsyncBackend, Backend
+from .path import PathResolver
 from .register import Register
+from .snapshot import Snapshot
+from .transaction import Transaction
 
 GroupInstanceType = TypeVar("GroupInstanceType", bound="Group")
 GroupType = TypeVar("GroupType", bound=type)
+RegisterPath = tuple[int | str, ...]
+
+
+class GroupView:
+    __slots__ = ("_group", "_index")
+
+    _group: Group
+    _index: int
+
+    def __init__(self, group: Group, index: int) -> None:
+        object.__setattr__(self, "_group", group)
+        object.__setattr__(self, "_index", index)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        raise AttributeError(f"Cannot set attribute {attr} on group view")
+
+    def __str__(self) -> str:
+        return self._group._name
+
+    def __len__(self) -> int:
+        return self._group._size
+
+    @property
+    def group(self) -> Group:
+        return self._group
+
+    @property
+    def index(self) -> int:
+        return self._index
+
+    @property
+    def name(self) -> str:
+        return self._group._name
+
+    @property
+    def address(self) -> int:
+        return self._group._address + self._group._offset[self._index]
+
+    @property
+    def offset(self) -> int:
+        return self._group._offset[self._index]
 
 
 class Group:
+    _children: dict[str, Any] = {}
+    _names: dict[str, str] = {}
+    _origin: int = 0
+    _relative: dict[tuple[str, int], int] = {}
+    _table: tuple[tuple[RegisterPath, int, Register], ...] = ()
+    _view: type[GroupView] = GroupView
+    _backend: Backend | None = None
+    _async_backend: AsyncBackend | None = None
+    _sorted: list[Register] | None = None
+    _addresses: array[int] | None = None
+    _base: dict[tuple[str, int], Any] = {}
+    _resolver: PathResolver | None = None
+
     def __init__(self) -> None:
         self._name: str = ""
         self._address: int = 0
         self._offset: list[int] = []
         self._size: int = 1
-        self._index: int = 0
+        self._elements: dict[tuple[str, int], Any] = {}
 
     def __str__(self) -> str:
         return self._name
@@ -25,15 +85,190 @@ class Group:
     def __len__(self) -> int:
         return self._size
 
-    def __getitem__(self: GroupInstanceType, index: int) -> GroupInstanceType:
+    def __getitem__(self, index: int) -> GroupView:
         if not isinstance(index, int):
             raise TypeError(f"Index must be an integer, got {type(index).__name__}")
         if index < 0:
             raise IndexError("Index must be a non-negative integer")
         if index >= len(self):
             raise IndexError(f"Index {index} out of range for group {self._name}")
-        self._index = index
-        return self
+        return self._view(self, index)
+
+    def _child(self, attr: str, index: int) -> Any:
+        key = (attr, index)
+        element = self._elements.get(key)
+        if element is None:
+            element = deepcopy(self._children[attr])
+            element._address = self._address + self._relative[key]
+            frozen = self._base.get(key)
+            if frozen is not None and isinstance(element, Group):
+                element._base = frozen
+            elif frozen is not None:
+                element._value = frozen
+            if self._backend is not None:
+                element.attach(self._backend)
+            if self._async_backend is not None:
+                element.attach(self._async_backend)
+            element = self._elements.setdefault(key, element)
+        return element
+
+    def _registers(self) -> list[Register]:
+        if self._sorted is None:
+            self._sorted = sorted((self._resolve(path) for path, _, _ in self._walk()), key=lambda x: x.address)
+        return self._sorted
+
+    def _accessible(self, excluded: AccessType) -> list[Register]:
+        return [register for register in self._registers() if register._access != excluded]
+
+    def read_all(self, gap: int = 0) -> dict[int, int]:
+        return self._read(self._registers(), gap)
+
+    def _read(self, registers: list[Register], gap: int) -> dict[int, int]:
+        if self._backend is None:
+            return {register.address: register.value for register in registers}
+        backend = self._backend
+        values: dict[int, int] = {}
+        singles: list[tuple[int, list[tuple[int, Register]]]] = []
+        for start, count, members in _plan_bursts(registers, backend.width, gap):
+            if count > 1:
+                _scatter(members, backend.read_block(start, count), values)
+            else:
+                singles.append((start, members))
+        for (_, members), word in zip(singles, backend.read_many([start for start, _ in singles]), strict=True):
+            _scatter(members, [word], values)
+        return values
+
+    def write_all(self) -> None:
+        self._write(self._accessible(AccessType.ReadOnly))
+
+    def _write(self, registers: list[Register]) -> None:
+        if self._backend is None:
+            return
+        backend = self._backend
+        for start, count, members in _plan_bursts(registers, backend.width, 0):
+            words = _gather(members, count)
+            if count > 1:
+                backend.write_block(start, words)
+            else:
+                backend.write(start, words[0])
+
+    async def aread_all(self, gap: int = 0) -> dict[int, int]:
+        registers = self._registers()
+        if self._async_backend is None:
+            return self.read_all(gap)
+        backend = self._async_backend
+        bursts = _plan_bursts(registers, backend.width, gap)
+        results = await asyncio.gather(*(_aread_burst(backend, start, count) for start, count, _ in bursts))
+        values: dict[int, int] = {}
+        for (_, _, members), words in zip(bursts, results, strict=True):
+            _scatter(members, words, values)
+        return values
+
+    async def awrite_all(self) -> None:
+        registers = self._accessible(AccessType.ReadOnly)
+        if self._async_backend is None:
+            self.write_all()
+            return
+        backend = self._async_backend
+        writes = []
+        for start, count, members in _plan_bursts(registers, backend.width, 0):
+            words = _gather(members, count)
+            writes.append(backend.awrite_block(start, words) if count > 1 else backend.awrite(start, words[0]))
+        await asyncio.gather(*writes)
+
+    def transaction(self) -> Transaction:
+        return Transaction(self)
+
+    def _freeze(self) -> dict[tuple[str, int], Any]:
+        if not self._elements:
+            return self._base
+        frozen = dict(self._base)
+        for key, element in self._elements.items():
+            if isinstance(element, Group):
+                state: Any = element._freeze()
+                pristine = not state
+            else:
+                state = element._value
+                pristine = state == self._children[key[0]]._value
+            if key in frozen or not pristine:
+                frozen[key] = state
+        return frozen
+
+    def clone(self: GroupInstanceType) -> GroupInstanceType:
+        instance = copy(self)
+        instance._base = self._freeze()
+        instance._elements = {}
+        instance._sorted = None
+        instance._resolver = None
+        return instance
+
+    def _address_table(self, registers: list[Register]) -> array[int]:
+        if self._addresses is None:
+            self._addresses = array("Q", [register.address for register in registers])
+        return self._addresses
+
+    def snapshot(self) -> Snapshot:
+        registers = self._accessible(AccessType.WriteOnly)
+        addresses = self._address_table(registers)
+        if self._backend is not None:
+            self._read(registers, 0)
+        return Snapshot(addresses, array("Q", [register._value for register in registers]), registers)
+
+    def restore(self, snapshot: Snapshot) -> None:
+        registers = self._accessible(AccessType.WriteOnly)
+        addresses = self._address_table(registers)
+        if snapshot.addresses is not addresses and snapshot.addresses != addresses:
+            raise ValueError("Snapshot was taken from a different register layout")
+        writable = []
+        for register, value in zip(registers, snapshot.values, strict=True):
+            if register._access == AccessType.ReadWrite:
+                register._value = value
+                writable.append(register)
+        self._write(writable)
+
+    def invalidate(self) -> None:
+        if self._backend is not None:
+            self._backend.invalidate([address for _, address, _ in self._walk()])
+
+    def flush(self) -> None:
+        if self._backend is not None:
+            self._backend.flush(sorted(address for _, address, _ in self._walk()))
+
+    def attach(self, backend: Backend | AsyncBackend | None) -> None:
+        if isinstance(backend, AsyncBackend):
+            self._async_backend = backend
+        else:
+            self._backend = backend
+            if backend is None:
+                self._async_backend = None
+        for element in self._elements.values():
+            element.attach(backend)
+
+    @classmethod
+    def address_map(cls) -> dict[RegisterPath, int]:
+        return {path: cls._origin + relative for path, relative, _ in cls._table}
+
+    def _walk(self) -> Iterator[tuple[RegisterPath, int, Register]]:
+        address = self._address
+        for path, relative, template in self._table:
+            yield path, address + relative, template
+
+    def _paths(self) -> PathResolver:
+        if self._resolver is None:
+            self._resolver = PathResolver(self)
+        return self._resolver
+
+    def lookup(self, path: str) -> Any:
+        return self._paths().lookup(path)
+
+    def glob(self, pattern: str) -> list[Any]:
+        return self._paths().glob(pattern)
+
+    def _resolve(self, path: RegisterPath) -> Any:
+        node: Any = self
+        for position in range(0, len(path) - 1, 2):
+            node = node._child(path[position + 1], path[position])
+        return node
 
     @property
     def name(self) -> str:
@@ -41,25 +276,65 @@ class Group:
 
     @property
     def address(self) -> int:
-        return self._address + self._offset[self._index]
+        return self._address + self._offset[0]
+
+    @property
+    def backend(self) -> Backend | None:
+        return self._backend
+
+    @property
+    def async_backend(self) -> AsyncBackend | None:
+        return self._async_backend
 
     @property
     def offset(self) -> int:
-        return self._offset[self._index]
+        return self._offset[0]
+
+
+def _plan_bursts(registers: list[Register], width: int, gap: int) -> list[tuple[int, int, list[tuple[int, Register]]]]:
+    bursts: list[tuple[int, int, list[tuple[int, Register]]]] = []
+    for register in registers:
+        address = register.address
+        if bursts:
+            start, count, members = bursts[-1]
+            end = start + (count * width)
+            if (address - start) % width == 0 and address - end <= gap:
+                word = (address - start) // width
+                members.append((word, register))
+                bursts[-1] = (start, max(count, word + 1), members)
+                continue
+        bursts.append((address, 1, [(0, register)]))
+    return bursts
+
+
+async def _aread_burst(backend: AsyncBackend, start: int, count: int) -> list[int]:
+    if count > 1:
+        return await backend.aread_block(start, count)
+    return [await backend.aread(start)]
 
 
-def _setup_children(cls: GroupType, size: int, children_type: type) -> GroupType:
+def _scatter(members: list[tuple[int, Register]], words: list[int], values: dict[int, int]) -> None:
+    for word, register in members:
+        register._value = words[word]
+        values[register.address] = words[word]
+
+
+def _gather(members: list[tuple[int, Register]], count: int) -> list[int]:
+    words = [0] * count
+    for word, register in members:
+        words[word] = register._value
+    return words
+
+
+def _setup_children(cls: GroupType, children_type: type) -> GroupType:
     children = {attr: value for attr, value in cls.__dict__.items() if isinstance(value, children_type)}
-    for attr, value in children.items():
-        instances = tuple(deepcopy(value) for _ in range(size))
-        setattr(cls, f"_{attr}", instances)
+    cls._children = {**cls._children, **children}  # type: ignore[attr-defined]
+    cls._names = {**cls._names, **{template._name: attr for attr, template in children.items()}}  # type: ignore[attr-defined]
 
     for attr, _ in children.items():
 
         def getter(self: GroupType, attr: str = attr) -> Any:
-            child = getattr(self, f"_{attr}")[self._index]  # type: ignore[attr-defined]
-            self._index = 0  # type: ignore[attr-defined]
-            return child
+            return self._child(attr, 0)  # type: ignore[attr-defined]
 
         def setter(self: GroupType, value: Any, attr: str = attr) -> None:
             raise AttributeError(f"Cannot set value directly on {attr}. Use {attr}.value = <value> instead.")
@@ -69,31 +344,53 @@ def _setup_children(cls: GroupType, size: int, children_type: type) -> GroupType
     return cls
 
 
-def _setup_registers(cls: GroupType, size: int) -> GroupType:
-    return _setup_children(cls, size, Register)
+def _setup_view(cls: GroupType) -> GroupType:
+    properties: dict[str, Any] = {"__slots__": ()}
+    for attr in cls._children:  # type: ignore[attr-defined]
+
+        def getter(self: GroupView, attr: str = attr) -> Any:
+            return self._group._child(attr, self._index)
+
+        properties[attr] = property(getter)
+
+    cls._view = type(f"{cls.__name__}View", (GroupView,), properties)  # type: ignore[attr-defined]
+    return cls
+
+
+def _setup_registers(cls: GroupType) -> GroupType:
+    return _setup_children(cls, Register)
+
+
+def _setup_groups(cls: GroupType) -> GroupType:
+    return _setup_children(cls, Group)
 
 
-def _setup_groups(cls: GroupType, size: int) -> GroupType:
-    return _setup_children(cls, size, Group)
+def _setup_table(cls: GroupType, address: int, offset: list[int]) -> GroupType:
+    relative = {}
+    table: list[tuple[RegisterPath, int, Register]] = []
+    for index, base in enumerate(offset):
+        for attr, template in cls._children.items():  # type: ignore[attr-defined]
+            start = relative[(attr, index)] = base + template._address
+            if isinstance(template, Group):
+                table.extend(((index, attr, *path), start + position, register) for path, position, register in template._table)
+            else:
+                table.append(((index, attr), start, template))
+    cls._origin = address  # type: ignore[attr-defined]
+    cls._relative = relative  # type: ignore[attr-defined]
+    cls._table = tuple(table)  # type: ignore[attr-defined]
+    return cls
 
 
 def _setup_init(cls: GroupType, name: str, address: int, offset: list[int], size: int) -> GroupType:
     init = getattr(cls, "__init__", None)
 
-    registers = getmembers(cls, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Register) for y in x))
-    groups = getmembers(cls, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Group) for y in x))
-
     def __init__(self: GroupType) -> None:
         if init is not None:
             init(self)
         self._name = name  # type: ignore[attr-defined]
+        self._address = address  # type: ignore[attr-defined]
         self._offset = offset  # type: ignore[attr-defined]
         self._size = size  # type: ignore[attr-defined]
-        for attr, value in registers:
-            setattr(self, attr, tuple(deepcopy(x) for x in value))
-        for attr, value in groups:
-            setattr(self, attr, tuple(deepcopy(x) for x in value))
-        self._update_address(address, offset)  # type: ignore[attr-defined]
 
     cls.__init__ = __init__  # type: ignore[misc]
     return cls
@@ -102,37 +399,14 @@ def _setup_init(cls: GroupType, name: str, address: int, offset: list[int], size
 def _deepcopy(self: GroupInstanceType, memo: dict[int, Any]) -> GroupInstanceType:
     instance = copy(self)
     memo[id(self)] = instance
-    registers = getmembers(instance, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Register) for y in x))
-    for reg in registers:
-        new = tuple(deepcopy(x, memo) for x in reg[1])
-        setattr(instance, reg[0], new)
-    groups = getmembers(instance, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Group) for y in x))
-    for group in groups:
-        new = tuple(deepcopy(x, memo) for x in group[1])
-        setattr(instance, group[0], new)
+    instance._elements = {key: deepcopy(value, memo) for key, value in self._elements.items()}
+    instance._sorted = None
+    instance._resolver = None
     return instance
 
 
-def _update_address(self: GroupInstanceType, address: int, offset: list[int] | None = None) -> GroupInstanceType:
-    self._address = address + self._address
-    registers = getmembers(self, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Register) for y in x))
-    for i, reg in enumerate(registers):
-        for j, instance in enumerate(reg[1]):
-            offset2add = offset[j] if offset is not None else 0
-            registers[i][1][j]._address = address + instance._address + offset2add
-
-    groups = getmembers(self, lambda x: isinstance(x, list | tuple) and all(isinstance(y, Group) for y in x))
-    for i, group in enumerate(groups):
-        for j, _ in enumerate(group[1]):
-            offset2add = offset[j] if offset is not None else 0
-            groups[i][1][j]._update_address(address + offset2add)
-
-    return self
-
-
 def _setup_methods(cls: GroupType) -> GroupType:
     cls.__deepcopy__ = _deepcopy  # type: ignore[attr-defined]
-    cls._update_address = _update_address  # type: ignore[attr-defined]
     return cls
 
 
@@ -147,8 +421,10 @@ def group(name: str, address: int, offset: list[int] | int, size: int = 1) -> Ca
 
     def decorator(cls: GroupType) -> GroupType:
         cls = _setup_methods(cls)
-        cls = _setup_registers(cls, size)
-        cls = _setup_groups(cls, size)
+        cls = _setup_registers(cls)
+        cls = _setup_groups(cls)
+        cls = _setup_view(cls)
+        cls = _setup_table(cls, address, offset)
         cls = _setup_init(cls, name, address, offset, size)
 
         return cls
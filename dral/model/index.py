@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from .group import Group, RegisterPath
+from .register import Register
+
+
+class AddressIndex:
+    def __init__(self, group: Group) -> None:
+        self._group = group
+        self._addresses: list[int] = []
+        self._paths: list[RegisterPath] = []
+        self._lookup: dict[int, int] = {}
+        for path, address, _ in sorted(group._walk(), key=lambda x: x[1]):
+            if address in self._lookup:
+                continue
+            self._lookup[address] = len(self._addresses)
+            self._addresses.append(address)
+            self._paths.append(path)
+        self._registers: list[Register | None] = [None] * len(self._addresses)
+
+    def __len__(self) -> int:
+        return len(self._addresses)
+
+    def __contains__(self, address: object) -> bool:
+        return address in self._lookup
+
+    def __getitem__(self, address: int) -> Register:
+        if address not in self._lookup:
+            raise KeyError(f"No register at address {address:#010x}")
+        return self._register(self._lookup[address])
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._addresses)
+
+    def _register(self, position: int) -> Register:
+        register = self._registers[position]
+        if register is None:
+            register = self._group._resolve(self._paths[position])
+            self._registers[position] = register
+        return register
+
+    def get(self, address: int) -> Register | None:
+        position = self._lookup.get(address)
+        return None if position is None else self._register(position)
+
+    def path(self, address: int) -> RegisterPath:
+        if address not in self._lookup:
+            raise KeyError(f"No register at address {address:#010x}")
+        return self._paths[self._lookup[address]]
+
+    def range(self, lo: int, hi: int) -> list[Register]:
+        start = bisect_left(self._addresses, lo)
+        stop = bisect_left(self._addresses, hi)
+        return [self._register(position) for position in range(start, stop)]
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from time import perf_counter_ns
+from typing import Any
+
+from .field import BoundField, Field
+from .group import Group
+from .register import Register
+
+_BUCKETS = 64
+
+
+class AccessStats:
+    __slots__ = (
+        "name",
+        "address",
+        "reads",
+        "writes",
+        "redundant_writes",
+        "read_ns",
+        "write_ns",
+        "read_histogram",
+        "write_histogram",
+        "last",
+        "_fields",
+    )
+
+    def __init__(self, name: str, address: int, fields: Iterable[str] = ()) -> None:
+        self.name = name
+        self.address = address
+        self._fields: dict[str, list[int]] = {field: [0, 0] for field in fields}
+        self.clear()
+
+    def clear(self) -> None:
+        self.reads = 0
+        self.writes = 0
+        self.redundant_writes = 0
+        self.read_ns = 0
+        self.write_ns = 0
+        self.read_histogram = [0] * _BUCKETS
+        self.write_histogram = [0] * _BUCKETS
+        for counts in self._fields.values():
+            counts[0] = counts[1] = 0
+        self.last: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"AccessStats({self.name!r}, {self.address:#010x}, reads={self.reads}, writes={self.writes}, redundant={self.redundant_writes})"
+        )
+
+    @property
+    def accesses(self) -> int:
+        return self.reads + self.writes
+
+    @property
+    def mean_read_ns(self) -> float:
+        return self.read_ns / self.reads if self.reads else 0.0
+
+    @property
+    def mean_write_ns(self) -> float:
+        return self.write_ns / self.writes if self.writes else 0.0
+
+    @property
+    def fields(self) -> dict[str, list[int]]:
+        return {name: list(counts) for name, counts in self._fields.items() if counts[0] or counts[1]}
+
+    @property
+    def histogram(self) -> dict[int, tuple[int, int]]:
+        buckets = enumerate(zip(self.read_histogram, self.write_histogram, strict=True))
+        return {1 << bucket: (reads, writes) for bucket, (reads, writes) in buckets if reads or writes}
+
+
+class _InstrumentedBoundField(BoundField):
+    __slots__ = ()
+
+    @property
+    def value(self) -> int:
+        register = self._register
+        field = self._field
+        register._stats._fields[field._name][0] += 1  # type: ignore[attr-defined]
+        return (register.value >> field._position) & field._mask
+
+    @value.setter
+    def value(self, value: int) -> None:
+        register = self._register
+        field = self._field
+        register._stats._fields[field._name][1] += 1  # type: ignore[attr-defined]
+        mask = field._mask << field._position
+        register.value = (register.value & ~mask) | ((value << field._position) & mask)
+
+
+class _InstrumentedField:
+    __slots__ = ("_field",)
+
+    def __init__(self, field: Field) -> None:
+        self._field = field
+
+    def __get__(self, instance: Register | None, owner: type | None = None) -> Field | BoundField:
+        return self._field if instance is None else _InstrumentedBoundField(instance, self._field)
+
+    def __set__(self, instance: Register, value: Any) -> None:
+        self._field.__set__(instance, value)
+
+
+_classes: dict[type, type] = {}
+
+
+def _instrumented_register(cls: type[Register]) -> type[Register]:
+    getter = cls.value.fget  # type: ignore[attr-defined]
+    setter = cls.value.fset  # type: ignore[attr-defined]
+
+    def get(self: Any) -> int:
+        start = perf_counter_ns()
+        value = getter(self)
+        elapsed = perf_counter_ns() - start
+        stats = self._stats
+        stats.reads += 1
+        stats.read_ns += elapsed
+        stats.read_histogram[elapsed.bit_length()] += 1
+        stats.last = value
+        return value  # type: ignore[no-any-return]
+
+    def put(self: Any, value: int) -> None:
+        start = perf_counter_ns()
+        setter(self, value)
+        elapsed = perf_counter_ns() - start
+        stats = self._stats
+        if stats.last == value:
+            stats.redundant_writes += 1
+        stats.writes += 1
+        stats.write_ns += elapsed
+        stats.write_histogram[elapsed.bit_length()] += 1
+        stats.last = value
+
+    members: dict[str, Any] = {"value": property(get, put), "_original": cls}
+    for attr, field in zip(cls._layout, cls._fields, strict=True):
+        members[attr] = members[attr[1:]] = _InstrumentedField(field)
+    return type(f"Instrumented{cls.__name__}", (cls,), members)
+
+
+def _instrumented_group(cls: type[Group]) -> type[Group]:
+    child = cls._child
+
+    def _child(self: Any, attr: str, index: int) -> Any:
+        element = self._elements.get((attr, index))
+        if element is None:
+            element = child(self, attr, index)
+            if getattr(element, "_profiler", None) is None:
+                self._profiler.instrument(element)
+        return element
+
+    return type(f"Instrumented{cls.__name__}", (cls,), {"_child": _child, "_original": cls})
+
+
+def _swap(target: Any, factory: Any) -> None:
+    cls = type(target)
+    if "_original" in cls.__dict__:
+        return
+    instrumented = _classes.get(cls)
+    if instrumented is None:
+        instrumented = _classes[cls] = factory(cls)
+    target.__class__ = instrumented
+
+
+def _restore(target: Any) -> None:
+    original = type(target).__dict__.get("_original")
+    if original is not None:
+        target.__class__ = original
+
+
+class Profiler:
+    def __init__(self) -> None:
+        self._stats: dict[int, AccessStats] = {}
+
+    def __getitem__(self, address: int) -> AccessStats:
+        return self._stats[address]
+
+    def __contains__(self, address: object) -> bool:
+        return address in self._stats
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def _stats_for(self, register: Register) -> AccessStats:
+        stats = self._stats.get(register._address)
+        if stats is None:
+            fields = (field.name for field in register._fields)
+            stats = self._stats[register._address] = AccessStats(register._name, register._address, fields)
+        return stats
+
+    def instrument(self, target: Register | Group) -> Register | Group:
+        if isinstance(target, Group):
+            target._profiler = self  # type: ignore[attr-defined]
+            for element in list(target._elements.values()):
+                self.instrument(element)
+            _swap(target, _instrumented_group)
+        else:
+            target._profiler = self  # type: ignore[attr-defined]
+            target._stats = self._stats_for(target)  # type: ignore[attr-defined]
+            _swap(target, _instrumented_register)
+        return target
+
+    def remove(self, target: Register | Group) -> Register | Group:
+        _restore(target)
+        if isinstance(target, Group):
+            for element in target._elements.values():
+                self.remove(element)
+        target.__dict__.pop("_profiler", None)
+        target.__dict__.pop("_stats", None)
+        return target
+
+    def reset(self) -> None:
+        for stats in self._stats.values():
+            stats.clear()
+
+    def top(self, count: int = 10, key: str = "accesses") -> list[AccessStats]:
+        return sorted(self._stats.values(), key=lambda x: (-getattr(x, key), x.address))[:count]
+
+    def report(self, count: int = 10, key: str = "accesses") -> str:
+        lines = [f"{'register':<24} {'address':>10} {'reads':>8} {'writes':>8} {'redundant':>9} {'read ns':>10} {'write ns':>10}"]
+        for stats in self.top(count, key):
+            lines.append(
+                f"{stats.name:<24} {stats.address:#010x} {stats.reads:>8} {stats.writes:>8} {stats.redundant_writes:>9}"
+                f" {stats.mean_read_ns:>10.0f} {stats.mean_write_ns:>10.0f}"
+            )
+        return "\n".join(lines)
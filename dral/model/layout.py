@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from importlib import import_module
+from importlib.util import find_spec
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import Any
+
+from .access import AccessType
+from .field import Field
+from .group import Group, group
+from .register import Register, register
+
+_MAGIC = b"DRAL"
+_VERSION = 1
+_HEADER = Struct("<4sHHqqI")
+_ENTRY = Struct("<I")
+_STRING = Struct("<H")
+_GROUP = Struct("<QII")
+_OFFSET = Struct("<Q")
+_REGISTER = Struct("<QBH")
+_FIELD = Struct("<BB")
+
+_GROUP_TAG = 0
+_REGISTER_TAG = 1
+
+
+class LayoutError(ValueError):
+    pass
+
+
+def _fingerprint(source: str | Path | None) -> tuple[int, int]:
+    if source is None:
+        return 0, 0
+    stat = os.stat(source)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _string(value: str) -> bytes:
+    data = value.encode()
+    return _STRING.pack(len(data)) + data
+
+
+def _encode(node: Group | Register, attr: str, out: bytearray) -> None:
+    out += _string(attr)
+    out += _string(type(node).__name__)
+    out += _string(node._name)
+    if isinstance(node, Group):
+        out.append(_GROUP_TAG)
+        out += _GROUP.pack(node._address, node._size, len(node._children))
+        for offset in node._offset:
+            out += _OFFSET.pack(offset)
+        for child_attr, template in node._children.items():
+            _encode(template, child_attr, out)
+    else:
+        out.append(_REGISTER_TAG)
+        out += _REGISTER.pack(node._address, int(node._access), len(node._layout))
+        for field_attr, field in zip(node._layout, node._fields, strict=True):
+            out += _string(field_attr[1:])
+            out += _string(field.name)
+            out += _FIELD.pack(field.position, field.width)
+
+
+def dump_layout(groups: Iterable[Group | type[Group]], path: str | Path, source: str | Path | None = None) -> None:
+    roots = [x if isinstance(x, Group) else x() for x in groups]
+    body = bytearray()
+    entries: list[int] = []
+    for root in roots:
+        entries.append(len(body))
+        _encode(root, type(root).__name__, body)
+    size, mtime = _fingerprint(source)
+    header = _HEADER.pack(_MAGIC, _VERSION, 0, size, mtime, len(roots))
+    table = b"".join(_ENTRY.pack(_HEADER.size + (_ENTRY.size * len(roots)) + entry) for entry in entries)
+    path = Path(path)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(header + table + body)
+    os.replace(temporary, path)
+
+
+class _Reader:
+    def __init__(self, data: memoryview, position: int) -> None:
+        self._data = data
+        self._position = position
+
+    def unpack(self, layout: Struct) -> tuple[Any, ...]:
+        values = layout.unpack_from(self._data, self._position)
+        self._position += layout.size
+        return values
+
+    def string(self) -> str:
+        (length,) = self.unpack(_STRING)
+        value = bytes(self._data[self._position : self._position + length]).decode()
+        self._position += length
+        return value
+
+    def byte(self) -> int:
+        value = self._data[self._position]
+        self._position += 1
+        return value
+
+
+def _decode(reader: _Reader) -> tuple[str, type[Group] | type[Register]]:
+    attr = reader.string()
+    class_name = reader.string()
+    name = reader.string()
+    if reader.byte() == _REGISTER_TAG:
+        address, access, count = reader.unpack(_REGISTER)
+        fields: dict[str, Any] = {}
+        for _ in range(count):
+            field_attr = reader.string()
+            field_name = reader.string()
+            position, width = reader.unpack(_FIELD)
+            fields[field_attr] = Field(field_name, position, width)
+        return attr, register(name, address, AccessType(access))(type(class_name, (Register,), fields))
+    address, size, count = reader.unpack(_GROUP)
+    offset = [reader.unpack(_OFFSET)[0] for _ in range(size)]
+    members: dict[str, Any] = {}
+    for _ in range(count):
+        child_attr, child = _decode(reader)
+        members[child.__name__] = child
+        members[child_attr] = child()
+    return attr, group(name, address, offset)(type(class_name, (Group,), members))
+
+
+class LayoutCache:
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        with open(self._path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = memoryview(self._mmap)
+        try:
+            magic, version, _, self._size, self._mtime, count = _HEADER.unpack_from(self._data)
+        except Exception as error:
+            self.close()
+            raise LayoutError(f"Truncated layout cache {self._path}") from error
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise LayoutError(f"Unsupported layout cache {self._path}")
+        self._entries: dict[str, int] = {}
+        for index in range(count):
+            (position,) = _ENTRY.unpack_from(self._data, _HEADER.size + (_ENTRY.size * index))
+            self._entries[_Reader(self._data, position).string()] = position
+        self._classes: dict[str, type[Group]] = {}
+
+    def __enter__(self) -> LayoutCache:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __getitem__(self, name: str) -> type[Group]:
+        cls = self._classes.get(name)
+        if cls is None:
+            if name not in self._entries:
+                raise KeyError(f"No group {name} in layout cache {self._path}")
+            _, cls = _decode(_Reader(self._data, self._entries[name]))  # type: ignore[assignment]
+            self._classes[name] = cls  # type: ignore[assignment]
+        return cls  # type: ignore[return-value]
+
+    def __getattr__(self, name: str) -> type[Group]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError as error:
+            raise AttributeError(name) from error
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def fresh(self, source: str | Path) -> bool:
+        return (self._size, self._mtime) == _fingerprint(source)
+
+    def close(self) -> None:
+        self._data.release()
+        self._mmap.close()
+
+
+def load_layout(module: str, cache_dir: str | Path | None = None) -> LayoutCache:
+    spec = find_spec(module)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(f"No module named {module!r}", name=module)
+    source = Path(spec.origin)
+    path = Path(cache_dir if cache_dir is not None else source.parent / "__pycache__") / f"{module}.dral"
+    if path.exists():
+        try:
+            cache = LayoutCache(path)
+        except LayoutError:
+            pass
+        else:
+            if cache.fresh(source):
+                return cache
+            cache.close()
+    namespace = import_module(module)
+    groups = [x for x in vars(namespace).values() if isinstance(x, type) and issubclass(x, Group) and x.__module__ == namespace.__name__]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dump_layout(groups, path, source)
+    return LayoutCache(path)
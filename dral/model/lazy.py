@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Mapping
+from importlib import import_module
+from pkgutil import iter_modules
+from typing import Any
+
+
+def lazy_package(name: str, exports: Mapping[str, str] | None = None) -> list[str]:
+    module = sys.modules[name]
+    exports = dict(exports or {})
+    submodules = sorted(info.name for info in iter_modules(module.__path__))
+
+    def __getattr__(attr: str) -> Any:
+        if attr in exports:
+            value = getattr(import_module(exports[attr], name), attr)
+        elif attr in submodules:
+            value = import_module(f".{attr}", name)
+        else:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}")
+        setattr(module, attr, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(module), *exports, *submodules})
+
+    module.__getattr__ = __getattr__  # type: ignore[method-assign]
+    module.__dir__ = __dir__  # type: ignore[method-assign]
+    names = list(exports) if exports else submodules
+    module.__all__ = names  # type: ignore[attr-defined]
+    return names
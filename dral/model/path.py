@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator, Sequence
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from .register import Register
+
+if TYPE_CHECKING:
+    from .group import Group
+
+_COMPONENT = re.compile(r"([^.\[\]]+)(?:\[(\d+|\*)\])?")
+_WILDCARDS = frozenset("*?")
+
+Component = tuple[str, "int | str | None"]
+
+
+def _parse(path: str) -> tuple[Component, ...]:
+    components: list[Component] = []
+    for part in path.split("."):
+        match = _COMPONENT.fullmatch(part)
+        if match is None:
+            raise ValueError(f"Invalid path component {part!r} in {path!r}")
+        name, index = match.groups()
+        components.append((name, int(index) if index is not None and index != "*" else index))
+    return tuple(components)
+
+
+def _is_pattern(components: Sequence[Component]) -> bool:
+    return any(index == "*" or not _WILDCARDS.isdisjoint(name) for name, index in components)
+
+
+def _matches(names: dict[str, str], pattern: str) -> list[str]:
+    if _WILDCARDS.isdisjoint(pattern):
+        attr = names.get(pattern)
+        return [] if attr is None else [attr]
+    return [attr for name, attr in names.items() if fnmatchcase(name, pattern)]
+
+
+def _indices(node: Group, index: int | str | None) -> range:
+    if index == "*":
+        return range(node._size)
+    if index is None:
+        return range(1) if node._size == 1 else range(0)
+    if isinstance(index, int) and 0 <= index < node._size:
+        return range(index, index + 1)
+    return range(0)
+
+
+def _expand(node: Group, index: int | str | None, components: Sequence[Component]) -> Iterator[Any]:
+    if not components:
+        if index is None:
+            yield node
+            return
+        for position in _indices(node, index):
+            yield node._view(node, position)
+        return
+    (name, child_index), rest = components[0], components[1:]
+    attrs = _matches(node._names, name)
+    for position in _indices(node, index):
+        for attr in attrs:
+            child = node._child(attr, position)
+            if not isinstance(child, Register):
+                yield from _expand(child, child_index, rest)
+            elif child_index is None and not rest:
+                yield child
+            elif child_index is None and len(rest) == 1 and rest[0][1] is None:
+                for field_attr in _matches(child._names, rest[0][0]):
+                    yield getattr(child, field_attr)
+
+
+class PathResolver:
+    def __init__(self, group: Group, maxsize: int | None = 1024) -> None:
+        self._group = group
+        self._lookup = lru_cache(maxsize)(self._find)
+        self._glob = lru_cache(maxsize)(self._find_all)
+
+    def _select(self, components: tuple[Component, ...]) -> Iterator[Any]:
+        (name, index), rest = components[0], components[1:]
+        if not fnmatchcase(self._group._name, name):
+            return iter(())
+        return _expand(self._group, index, rest)
+
+    def _find(self, path: str) -> Any:
+        components = _parse(path)
+        if _is_pattern(components):
+            raise ValueError(f"Path {path!r} contains wildcards, use glob() instead")
+        for element in self._select(components):
+            return element
+        raise KeyError(f"No element at path {path!r}")
+
+    def _find_all(self, pattern: str) -> tuple[Any, ...]:
+        return tuple(self._select(_parse(pattern)))
+
+    def lookup(self, path: str) -> Any:
+        return self._lookup(path)
+
+    def glob(self, pattern: str) -> list[Any]:
+        return list(self._glob(pattern))
+
+    def cache_info(self) -> Any:
+        return self._lookup.cache_info()
+
+    def clear(self) -> None:
+        self._lookup.cache_clear()
+        self._glob.cache_clear()
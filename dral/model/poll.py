@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+
+if TYPE_CHECKING:
+    from .backend import Backend
+    from .field import BoundField
+    from .register import Register
+
+Predicate: TypeAlias = Callable[[int], bool] | int
+Condition: TypeAlias = tuple["BoundField | Register", Predicate]
+
+
+class WaitResult(NamedTuple):
+    values: tuple[int, ...]
+    polls: int
+    elapsed: float
+
+
+class WaitTimeout(TimeoutError):
+    def __init__(self, result: WaitResult) -> None:
+        super().__init__(f"Condition not met after {result.polls} polls in {result.elapsed:.6f}s")
+        self.result = result
+
+
+class Backoff:
+    def __init__(self, spin: float = 100e-6, initial: float = 10e-6, maximum: float = 10e-3, factor: float = 2.0) -> None:
+        if spin < 0 or initial <= 0 or maximum < initial or factor < 1:
+            raise ValueError("Invalid backoff parameters")
+        self._spin = spin
+        self._initial = initial
+        self._maximum = maximum
+        self._factor = factor
+
+    @property
+    def spin(self) -> float:
+        return self._spin
+
+    @property
+    def initial(self) -> float:
+        return self._initial
+
+    @property
+    def maximum(self) -> float:
+        return self._maximum
+
+    @property
+    def factor(self) -> float:
+        return self._factor
+
+
+def _matches(predicate: Predicate, value: int) -> bool:
+    if isinstance(predicate, int):
+        return value == predicate
+    return predicate(value)
+
+
+def _sampler(targets: Sequence[Any]) -> Callable[[], tuple[int, ...]]:
+    registers: dict[int, Register] = {}
+    for target in targets:
+        register = getattr(target, "_register", target)
+        registers.setdefault(id(register), register)
+    batches: dict[int, tuple[Backend, list[Register], list[int]]] = {}
+    for register in registers.values():
+        if register._backend is not None:
+            backend, members, addresses = batches.setdefault(id(register._backend), (register._backend, [], []))
+            members.append(register)
+            addresses.append(register._address)
+
+    def sample() -> tuple[int, ...]:
+        for backend, members, addresses in batches.values():
+            for register, value in zip(members, backend.read_many(addresses), strict=True):
+                register._value = value
+        return tuple(target._value for target in targets)
+
+    return sample
+
+
+def wait_for(
+    conditions: Sequence[Condition], timeout: float | None = 1.0, backoff: Backoff | None = None, require_all: bool = True
+) -> WaitResult:
+    if not conditions:
+        raise ValueError("At least one condition is required")
+    backoff = _DEFAULT_BACKOFF if backoff is None else backoff
+    sample = _sampler([target for target, _ in conditions])
+    predicates = [predicate for _, predicate in conditions]
+    check = all if require_all else any
+    start = time.perf_counter()
+    spin = start + backoff.spin
+    deadline = None if timeout is None else start + timeout
+    delay = backoff.initial
+    polls = 0
+    while True:
+        values = sample()
+        polls += 1
+        now = time.perf_counter()
+        if check(_matches(predicate, value) for predicate, value in zip(predicates, values, strict=True)):
+            return WaitResult(values, polls, now - start)
+        if deadline is not None and now >= deadline:
+            raise WaitTimeout(WaitResult(values, polls, now - start))
+        if now < spin:
+            continue
+        time.sleep(delay if deadline is None else min(delay, deadline - now))
+        delay = min(delay * backoff.factor, backoff.maximum)
+
+
+_DEFAULT_BACKOFF = Backoff()
@@ -1,42 +1,90 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from copy import copy, deepcopy
-from inspect import getmembers
+from copy import copy
 from typing import Any, TypeVar
 
 from .access import AccessType
+from .backend import AsyncBackend, Backend
 from .field import Field
+from .poll import Backoff, Predicate, WaitResult, wait_for
+from .transaction import Transaction
 
 
 class Register:
+    _layout: tuple[str, ...] = ()
+    _fields: tuple[Field, ...] = ()
+    _names: dict[str, str] = {}
+    _backend: Backend | None = None
+    _async_backend: AsyncBackend | None = None
+
     def __init__(self) -> None:
         self._name: str = ""
         self._address: int = 0
         self._access: AccessType = AccessType.ReadWrite
         self._value: int = 0
-        self._fields: tuple[Field, ...] = self._get_all_fields()
-
-    def _get_all_fields(self) -> tuple[Field, ...]:
-        field_members = getmembers(self, lambda x: isinstance(x, Field))
-        fields = [x[1] for x in field_members if x[0].startswith("_")]
-        return tuple(sorted(fields, key=lambda x: x.position))
 
     def __str__(self) -> str:
         return self._name
 
-    def _clear_value(self) -> None:
-        for field in self._fields:
-            self._value &= ~(field.mask << field.position)
+    def _load(self) -> int:
+        self._value = self._backend.read(self._address)  # type: ignore[union-attr]
+        return self._value
 
-    def _set_value(self) -> None:
-        self._clear_value()
-        for field in self._fields:
-            self._value |= (field.value & field.mask) << field.position
+    def _store(self, value: int) -> None:
+        self._value = value
+        self._backend.write(self._address, value)  # type: ignore[union-attr]
+
+    def _write_field(self, field: Field, value: int) -> None:
+        mask = field.mask << field.position
+        self._store((self._load() & ~mask) | ((value << field.position) & mask))
+
+    def attach(self, backend: Backend | AsyncBackend | None) -> None:
+        if isinstance(backend, AsyncBackend):
+            self._async_backend = backend
+            return
+        self._backend = backend
+        if backend is None:
+            self._async_backend = None
+        else:
+            backend.bind(self)
 
-    def _update_fields(self) -> None:
-        for field in self._fields:
-            field.value = (self._value >> field.position) & field.mask
+    @property
+    def backend(self) -> Backend | None:
+        return self._backend
+
+    @property
+    def async_backend(self) -> AsyncBackend | None:
+        return self._async_backend
+
+    async def aread(self) -> int:
+        if self._async_backend is None:
+            return self.value
+        self._value = await self._async_backend.aread(self._address)
+        return self._value
+
+    async def awrite(self, value: int | None = None) -> None:
+        if value is None:
+            value = self._value
+        if self._async_backend is None:
+            self.value = value
+            return
+        self._value = value
+        await self._async_backend.awrite(self._address, value)
+
+    def transaction(self) -> Transaction:
+        return Transaction(self)
+
+    def wait_until(self, predicate: Predicate, timeout: float | None = 1.0, backoff: Backoff | None = None) -> WaitResult:
+        return wait_for(((self, predicate),), timeout, backoff)
+
+    def invalidate(self) -> None:
+        if self._backend is not None:
+            self._backend.invalidate((self._address,))
+
+    def flush(self) -> None:
+        if self._backend is not None:
+            self._backend.flush((self._address,))
 
     @property
     def name(self) -> str:
@@ -52,13 +100,16 @@ class Register:
 
     @property
     def value(self) -> int:
-        self._set_value()
+        if self._backend is not None:
+            return self._load()
         return self._value
 
     @value.setter
     def value(self, value: int) -> None:
+        if self._backend is not None:
+            self._store(value)
+            return
         self._value = value
-        self._update_fields()
 
 
 RegisterInstanceType = TypeVar("RegisterInstanceType", bound="Register")
@@ -69,35 +120,17 @@ def _setup_fields(cls: RegisterType) -> RegisterType:
     fields = {attr: value for attr, value in cls.__dict__.items() if isinstance(value, Field)}
     for attr, field in fields.items():
         setattr(cls, f"_{attr}", field)
-
-    for attr, _ in fields.items():
-
-        def getter(self: RegisterType, attr: str = attr) -> Any:
-            return getattr(self, f"_{attr}")
-
-        def setter(self: RegisterType, value: Any, attr: str = attr) -> None:
-            raise AttributeError(f"Cannot set value directly on {attr}. Use {attr}.value = <value> instead.")
-
-        setattr(cls, attr, property(getter, setter))
-
     return cls
 
 
 def _deepcopy(self: RegisterInstanceType, memo: dict[int, Any]) -> RegisterInstanceType:
     instance = copy(self)
     memo[id(self)] = instance
-    fields = getmembers(instance, lambda x: isinstance(x, Field))
-    fields = [x for x in fields if x[0].startswith("_")]
-    for field in fields:
-        new = deepcopy(field[1], memo)
-        setattr(instance, field[0], new)
-    instance._fields = instance._get_all_fields()
     return instance
 
 
 def _setup_init(cls: RegisterType, name: str, address: int, access: AccessType) -> RegisterType:
     init = getattr(cls, "__init__", None)
-    fields = getmembers(cls, lambda x: isinstance(x, Field))
 
     def __init__(self: RegisterType) -> None:
         if init is not None:
@@ -105,13 +138,25 @@ def _setup_init(cls: RegisterType, name: str, address: int, access: AccessType)
         self._name = name  # type: ignore[attr-defined]
         self._address = address  # type: ignore[attr-defined]
         self._access = access  # type: ignore[attr-defined]
-        for attr, value in fields:
-            setattr(self, attr, deepcopy(value))
 
     cls.__init__ = __init__  # type: ignore[misc]
     return cls
 
 
+def _setup_layout(cls: RegisterType) -> RegisterType:
+    found = {
+        attr: value
+        for klass in reversed(cls.__mro__)
+        for attr, value in vars(klass).items()
+        if attr.startswith("_") and isinstance(value, Field)
+    }
+    members = sorted(sorted(found.items()), key=lambda x: x[1].position)
+    cls._layout = tuple(attr for attr, _ in members)  # type: ignore[attr-defined]
+    cls._fields = tuple(field for _, field in members)  # type: ignore[attr-defined]
+    cls._names = {field.name: attr for attr, field in members}  # type: ignore[attr-defined]
+    return cls
+
+
 def _setup_methods(cls: RegisterType) -> RegisterType:
     cls.__deepcopy__ = _deepcopy  # type: ignore[attr-defined]
     return cls
@@ -121,6 +166,7 @@ def register(name: str, address: int, access: AccessType = AccessType.ReadWrite)
     def decorator(cls: RegisterType) -> RegisterType:
         cls = _setup_methods(cls)
         cls = _setup_fields(cls)
+        cls = _setup_layout(cls)
         cls = _setup_init(cls, name, address, access)
 
         return cls
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import socket
+import socketserver
+import threading
+from collections import deque
+from collections.abc import Iterable, Sequence
+from concurrent.futures import Future
+from contextlib import suppress
+from itertools import count
+from struct import Struct
+from types import TracebackType
+
+from .backend import Backend
+
+_REQUEST = Struct("<BIQI")
+_RESPONSE = Struct("<IBI")
+_WORD = 8
+
+_READ = 0
+_WRITE = 1
+_READ_BLOCK = 2
+_WRITE_BLOCK = 3
+
+
+class RemoteError(RuntimeError):
+    pass
+
+
+def _pack(values: Sequence[int]) -> bytes:
+    return Struct(f"<{len(values)}Q").pack(*values)
+
+
+def _unpack(data: bytes) -> list[int]:
+    return list(Struct(f"<{len(data) // _WORD}Q").unpack(data))
+
+
+class _Connection:
+    def __init__(self, host: str, port: int, timeout: float | None) -> None:
+        self._socket = socket.create_connection((host, port), timeout=timeout)
+        self._socket.settimeout(None)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        self._lock = threading.Lock()
+        self._ids = count()
+        self._pending: dict[int, Future[list[int]]] = {}
+        self._closed = False
+        self._thread = threading.Thread(target=self._receive, name=f"dral-remote-{host}:{port}", daemon=True)
+        self._thread.start()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, op: int, address: int, size: int, values: Sequence[int] = ()) -> Future[list[int]]:
+        future: Future[list[int]] = Future()
+        with self._lock:
+            if self._closed:
+                raise ConnectionError("Connection to remote target is closed")
+            request_id = next(self._ids) & 0xFFFFFFFF
+            self._pending[request_id] = future
+            try:
+                self._socket.sendall(_REQUEST.pack(op, request_id, address, size) + _pack(values))
+            except BaseException:
+                del self._pending[request_id]
+                raise
+        return future
+
+    def _receive(self) -> None:
+        try:
+            while True:
+                header = self._reader.read(_RESPONSE.size)
+                if len(header) < _RESPONSE.size:
+                    break
+                request_id, status, size = _RESPONSE.unpack(header)
+                with self._lock:
+                    future = self._pending.pop(request_id)
+                if status:
+                    future.set_exception(RemoteError(self._reader.read(size).decode()))
+                else:
+                    future.set_result(_unpack(self._reader.read(size * _WORD)))
+        except OSError:
+            pass
+        finally:
+            with self._lock:
+                self._closed = True
+                pending = list(self._pending.values())
+                self._pending.clear()
+            for future in pending:
+                future.set_exception(ConnectionError("Connection to remote target lost"))
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        with suppress(OSError):
+            self._socket.shutdown(socket.SHUT_RDWR)
+        self._thread.join()
+        self._reader.close()
+        self._socket.close()
+
+
+class _Pool:
+    def __init__(self, host: str, port: int, size: int, timeout: float | None) -> None:
+        self._host = host
+        self._port = port
+        self._size = size
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._next = count()
+        self._connections: list[_Connection] = []
+        self._local = threading.local()
+
+    def connection(self) -> _Connection:
+        connection: _Connection | None = getattr(self._local, "connection", None)
+        if connection is None or connection.closed:
+            with self._lock:
+                index = next(self._next) % self._size
+                if index >= len(self._connections):
+                    self._connections.append(_Connection(self._host, self._port, self._timeout))
+                elif self._connections[index].closed:
+                    self._connections[index] = _Connection(self._host, self._port, self._timeout)
+                connection = self._connections[index]
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+
+class RemoteBackend(Backend):
+    def __init__(self, host: str, port: int, pool_size: int = 4, width: int = 4, timeout: float | None = 10.0, posted: bool = True) -> None:
+        self._pool = _Pool(host, port, pool_size, timeout)
+        self._width = width
+        self._timeout = timeout
+        self._posted = posted
+        self._outstanding: deque[Future[list[int]]] = deque()
+
+    def __enter__(self) -> RemoteBackend:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    def _check(self) -> None:
+        while self._outstanding and self._outstanding[0].done():
+            self._outstanding.popleft().result()
+
+    def _wait(self, future: Future[list[int]]) -> list[int]:
+        self._check()
+        return future.result(self._timeout)
+
+    def _post(self, future: Future[list[int]]) -> None:
+        if self._posted:
+            self._outstanding.append(future)
+            self._check()
+        else:
+            self._wait(future)
+
+    def read(self, address: int) -> int:
+        return self._wait(self._pool.connection().submit(_READ, address, 1))[0]
+
+    def write(self, address: int, value: int) -> None:
+        self._post(self._pool.connection().submit(_WRITE, address, 1, (value,)))
+
+    def read_block(self, address: int, count: int) -> list[int]:
+        return self._wait(self._pool.connection().submit(_READ_BLOCK, address, count))
+
+    def write_block(self, address: int, values: Sequence[int]) -> None:
+        self._post(self._pool.connection().submit(_WRITE_BLOCK, address, len(values), values))
+
+    def read_many(self, addresses: Sequence[int]) -> list[int]:
+        connection = self._pool.connection()
+        futures = [connection.submit(_READ, address, 1) for address in addresses]
+        return [self._wait(future)[0] for future in futures]
+
+    def sync(self) -> None:
+        while self._outstanding:
+            self._outstanding.popleft().result(self._timeout)
+
+    def flush(self, addresses: Iterable[int] | None = None) -> None:
+        self.sync()
+
+    def close(self) -> None:
+        try:
+            self.sync()
+        finally:
+            self._pool.close()
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: _Server
+
+    def handle(self) -> None:
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        while True:
+            header = self.rfile.read(_REQUEST.size)
+            if len(header) < _REQUEST.size:
+                return
+            op, request_id, address, size = _REQUEST.unpack(header)
+            values = _unpack(self.rfile.read(size * _WORD)) if op in (_WRITE, _WRITE_BLOCK) else []
+            try:
+                with self.server.lock:
+                    result = self._dispatch(op, address, size, values)
+                response = _RESPONSE.pack(request_id, 0, len(result)) + _pack(result)
+            except Exception as error:
+                message = f"{type(error).__name__}: {error}".encode()
+                response = _RESPONSE.pack(request_id, 1, len(message)) + message
+            self.wfile.write(response)
+
+    def _dispatch(self, op: int, address: int, size: int, values: list[int]) -> list[int]:
+        backend = self.server.backend
+        if op == _READ:
+            return [backend.read(address)]
+        if op == _WRITE:
+            backend.write(address, values[0])
+            return []
+        if op == _READ_BLOCK:
+            return backend.read_block(address, size)
+        if op == _WRITE_BLOCK:
+            backend.write_block(address, values)
+            return []
+        raise ValueError(f"Unknown operation {op}")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], backend: Backend) -> None:
+        super().__init__(address, _Handler)
+        self.backend = backend
+        self.lock = threading.Lock()
+
+
+class RemoteServer:
+    def __init__(self, backend: Backend, host: str = "127.0.0.1", port: int = 0) -> None:
+        self._server = _Server((host, port), backend)
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> RemoteServer:
+        return self.start()
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.stop()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self._server.server_address[:2]
+        return str(host), int(port)
+
+    @property
+    def backend(self) -> Backend:
+        return self._server.backend
+
+    def start(self) -> RemoteServer:
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), name="dral-remote-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
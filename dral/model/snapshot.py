@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from .register import Register
+
+_CHUNK = 256
+
+
+class Change(NamedTuple):
+    address: int
+    name: str
+    old: int
+    new: int
+    fields: dict[str, tuple[int, int]]
+
+
+class Snapshot:
+    def __init__(self, addresses: array[int], values: array[int], registers: list[Register]) -> None:
+        self._addresses = addresses
+        self._values = values
+        self._registers = registers
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Snapshot):
+            return NotImplemented
+        return self._addresses == other._addresses and self._values == other._values
+
+    def __getitem__(self, address: int) -> int:
+        position = bisect_left(self._addresses, address)
+        if position == len(self._addresses) or self._addresses[position] != address:
+            raise KeyError(f"No register at address {address:#010x}")
+        return self._values[position]
+
+    @property
+    def addresses(self) -> array[int]:
+        return self._addresses
+
+    @property
+    def values(self) -> array[int]:
+        return self._values
+
+    def as_dict(self) -> dict[int, int]:
+        return dict(zip(self._addresses, self._values, strict=True))
+
+    def _changed(self, other: Snapshot) -> list[int]:
+        if self._addresses != other._addresses:
+            raise ValueError("Snapshots were taken from different register layouts")
+        old = self._values
+        new = other._values
+        changed: list[int] = []
+        for start in range(0, len(old), _CHUNK):
+            stop = start + _CHUNK
+            if old[start:stop] != new[start:stop]:
+                changed.extend(i for i in range(start, min(stop, len(old))) if old[i] != new[i])
+        return changed
+
+    def diff(self, other: Snapshot) -> list[Change]:
+        changes = []
+        for position in self._changed(other):
+            register = self._registers[position]
+            old = self._values[position]
+            new = other._values[position]
+            fields = {}
+            for field in register._fields:
+                before = (old >> field.position) & field.mask
+                after = (new >> field.position) & field.mask
+                if before != after:
+                    fields[field.name] = (before, after)
+            changes.append(Change(self._addresses[position], register.name, old, new, fields))
+        return changes
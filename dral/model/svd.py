@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable, Collection, Iterator
+from pathlib import Path
+from typing import IO, Any
+from xml.etree.ElementTree import Element, iterparse
+
+from .access import AccessType
+from .field import Field
+from .group import Group, group
+from .register import Register, register
+
+_ACCESS = {
+    "read-only": AccessType.ReadOnly,
+    "write-only": AccessType.WriteOnly,
+    "writeOnce": AccessType.WriteOnly,
+    "read-write": AccessType.ReadWrite,
+    "read-writeOnce": AccessType.ReadWrite,
+}
+_LISTS = ("registers", "fields")
+_CHUNK = 1 << 16
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, int):
+        return value
+    text = str(value).strip().lower()
+    if text.startswith("0x"):
+        return int(text, 16)
+    if text.startswith("#"):
+        return int(text[1:].replace("x", "0"), 2)
+    return int(text)
+
+
+def _access(value: str | None, default: AccessType) -> AccessType:
+    if value is None:
+        return default
+    if value not in _ACCESS:
+        raise ValueError(f"Unknown access type {value!r}")
+    return _ACCESS[value]
+
+
+def _name(value: str) -> str:
+    name = re.sub(r"\W", "_", value.replace("[%s]", "X").replace("%s", "X"))
+    return name[:1].upper() + name[1:]
+
+
+def _attr(name: str, suffix: str) -> str:
+    return f"{name[:1].lower()}{name[1:]}{suffix}"
+
+
+def _bits(description: dict[str, Any]) -> tuple[int, int]:
+    if "bitRange" in description:
+        msb, lsb = (int(x) for x in description["bitRange"].strip("[]").split(":"))
+        return lsb, msb - lsb + 1
+    if "lsb" in description:
+        lsb = _int(description["lsb"])
+        return lsb, _int(description["msb"]) - lsb + 1
+    return _int(description["bitOffset"]), _int(description["bitWidth"])
+
+
+def _build_register(description: dict[str, Any], access: AccessType) -> tuple[str, Any]:
+    access = _access(description.get("access"), access)
+    fields: dict[str, Any] = {}
+    for field in description.get("fields", ()):
+        position, width = _bits(field)
+        field_name = _name(field["name"])
+        fields[_attr(field_name, "Field")] = Field(field_name, position, width)
+    address = _int(description.get("addressOffset", 0))
+    dim = _int(description.get("dim", 0))
+    if not dim:
+        name = _name(description["name"])
+        cls = register(name, address, access)(type(f"{name}Register", (Register,), fields))
+        return _attr(name, "Register"), cls()
+    name = _name(description["name"].replace("[%s]", "").replace("%s", ""))
+    cls = register(name, 0, access)(type(f"{name}Register", (Register,), fields))
+    members = {cls.__name__: cls, _attr(name, "Register"): cls()}
+    wrapper = group(f"{name}X", address, _int(description["dimIncrement"]), dim)(type(f"{name}XGroup", (Group,), members))
+    return _attr(f"{name}X", "Group"), wrapper()
+
+
+def _build_children(descriptions: list[dict[str, Any]], access: AccessType) -> dict[str, Any]:
+    members: dict[str, Any] = {}
+    for description in descriptions:
+        attr, template = _build_cluster(description, access) if "registers" in description else _build_register(description, access)
+        members[type(template).__name__] = type(template)
+        members[attr] = template
+    return members
+
+
+def _build_cluster(description: dict[str, Any], access: AccessType) -> tuple[str, Any]:
+    name = _name(description["name"])
+    access = _access(description.get("access"), access)
+    dim = _int(description.get("dim", 1))
+    stride = _int(description.get("dimIncrement", 0))
+    members = _build_children(description["registers"], access)
+    cls = group(name, _int(description.get("addressOffset", 0)), stride, dim)(type(f"{name}Group", (Group,), members))
+    return _attr(name, "Group"), cls()
+
+
+def _build_peripheral(description: dict[str, Any], access: AccessType) -> type[Group]:
+    name = _name(description["name"])
+    access = _access(description.get("access"), access)
+    dim = _int(description.get("dim", 1))
+    stride = _int(description.get("dimIncrement", 0))
+    members = _build_children(description.get("registers", []), access)
+    return group(name, _int(description["baseAddress"]), stride, dim)(type(f"{name}Group", (Group,), members))
+
+
+def _scan(path: str | Path | IO[Any], targets: Callable[[Any], set[str]]) -> set[str] | None:
+    if isinstance(path, str | Path):
+        return targets(path)
+    if not path.seekable():
+        return None
+    position = path.tell()
+    try:
+        return targets(path)
+    finally:
+        path.seek(position)
+
+
+def _build(
+    peripherals: Iterator[dict[str, Any]], device: dict[str, Any], selected: Collection[str] | None, scan: Callable[[], set[str] | None]
+) -> Iterator[tuple[str, type[Group]]]:
+    targets = scan()
+    known: dict[str, dict[str, Any]] = {}
+    for description in peripherals:
+        source = description.get("derivedFrom")
+        if source is not None:
+            if source not in known:
+                raise ValueError(f"Peripheral {description['name']} derived from unknown peripheral {source}")
+            description = {**known[source], **{key: value for key, value in description.items() if key != "derivedFrom"}}
+        if targets is None or description["name"] in targets:
+            known[description["name"]] = description
+        name = _name(description["name"])
+        if selected is None or description["name"] in selected or name in selected:
+            yield name, _build_peripheral(description, _access(device.get("access"), AccessType.ReadWrite))
+
+
+def _element(element: Element) -> dict[str, Any] | str:
+    if len(element) == 0:
+        return (element.text or "").strip()
+    description: dict[str, Any] = dict(element.attrib)
+    for child in element:
+        if child.tag in _LISTS:
+            description[child.tag] = [_element(x) for x in child]
+        elif child.tag in ("register", "cluster"):
+            description.setdefault("registers", []).append(_element(child))
+        else:
+            description[child.tag] = _element(child)
+    return description
+
+
+def _svd_peripherals(path: str | Path | IO[bytes], device: dict[str, Any]) -> Iterator[Element]:
+    depth = 0
+    container: Element | None = None
+    for event, element in iterparse(path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if element.tag == "peripherals":
+                container = element
+            continue
+        depth -= 1
+        if element.tag == "peripheral" and container is not None:
+            yield element
+            container.remove(element)
+        elif depth == 1 and element.tag == "access":
+            device["access"] = (element.text or "").strip()
+        elif depth == 1:
+            element.clear()
+
+
+def _svd_targets(path: str | Path | IO[bytes]) -> set[str]:
+    peripherals = _svd_peripherals(path, {})
+    return {element.attrib["derivedFrom"] for element in peripherals if "derivedFrom" in element.attrib}
+
+
+def iter_svd(path: str | Path | IO[bytes], peripherals: Collection[str] | None = None) -> Iterator[tuple[str, type[Group]]]:
+    device: dict[str, Any] = {}
+    stream = (_element(element) for element in _svd_peripherals(path, device))
+    return _build(stream, device, peripherals, lambda: _scan(path, _svd_targets))  # type: ignore[arg-type]
+
+
+def _json_values(file: IO[str]) -> Iterator[tuple[str | None, Any]]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    eof = False
+
+    def fill() -> None:
+        nonlocal buffer, position, eof
+        chunk = file.read(_CHUNK)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+
+    def token() -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position].isspace():
+                position += 1
+            if position < len(buffer):
+                position += 1
+                return buffer[position - 1]
+            if eof:
+                raise ValueError("Unexpected end of JSON description")
+            fill()
+
+    def value() -> Any:
+        nonlocal position
+        token()
+        position -= 1
+        while True:
+            try:
+                result, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                fill()
+                continue
+            if end == len(buffer) and not eof:
+                fill()
+                continue
+            position = end
+            return result
+
+    if token() != "{":
+        raise ValueError("JSON description must be an object")
+    if token() == "}":
+        return
+    position -= 1
+    while True:
+        key = value()
+        if token() != ":":
+            raise ValueError(f"Expected ':' after key {key!r}")
+        if key != "peripherals":
+            yield key, value()
+        elif token() != "[":
+            raise ValueError("Peripherals must be a list")
+        elif token() != "]":
+            position -= 1
+            while True:
+                yield None, value()
+                separator = token()
+                if separator == "]":
+                    break
+                if separator != ",":
+                    raise ValueError(f"Unexpected {separator!r} in peripherals list")
+        separator = token()
+        if separator == "}":
+            return
+        if separator != ",":
+            raise ValueError(f"Unexpected {separator!r} in JSON description")
+
+
+def _json_items(file: IO[str], device: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for key, item in _json_values(file):
+        if key is None:
+            yield item
+        else:
+            device[key] = item
+
+
+def _json_peripherals(path: str | Path | IO[str], device: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    if isinstance(path, str | Path):
+        with open(path) as file:
+            yield from _json_items(file, device)
+    else:
+        yield from _json_items(path, device)
+
+
+def _json_targets(path: str | Path | IO[str]) -> set[str]:
+    return {item["derivedFrom"] for item in _json_peripherals(path, {}) if "derivedFrom" in item}
+
+
+def iter_json(path: str | Path | IO[str], peripherals: Collection[str] | None = None) -> Iterator[tuple[str, type[Group]]]:
+    device: dict[str, Any] = {}
+    return _build(_json_peripherals(path, device), device, peripherals, lambda: _scan(path, _json_targets))
+
+
+def load_svd(path: str | Path | IO[bytes], peripherals: Collection[str] | None = None) -> dict[str, type[Group]]:
+    return dict(iter_svd(path, peripherals))
+
+
+def load_json(path: str | Path | IO[str], peripherals: Collection[str] | None = None) -> dict[str, type[Group]]:
+    return dict(iter_json(path, peripherals))
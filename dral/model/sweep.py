@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, NamedTuple
+
+from .access import AccessType
+from .backend import Backend
+from .group import Group, RegisterPath
+from .register import Register
+
+Check = Callable[[Register], tuple[bool | None, str]]
+
+
+class SweepResult(NamedTuple):
+    path: RegisterPath
+    address: int
+    check: str
+    passed: bool | None
+    detail: str
+
+
+def _fields_mask(register: Register) -> int:
+    mask = 0
+    for field in register._fields:
+        mask |= field.mask << field.position
+    return mask
+
+
+def _check_reset(register: Register, expected: Mapping[int, int], default: int) -> tuple[bool | None, str]:
+    if register.access == AccessType.WriteOnly:
+        return None, "write-only register"
+    register.invalidate()
+    value = register.value
+    reset = expected.get(register.address, default)
+    if value != reset:
+        return False, f"read {value:#010x}, expected reset value {reset:#010x}"
+    return True, ""
+
+
+def check_reset(expected: Mapping[int, int] | None = None, default: int = 0) -> Check:
+    return partial(_check_reset, expected={} if expected is None else expected, default=default)
+
+
+def check_walking_ones(register: Register) -> tuple[bool | None, str]:
+    if register.access != AccessType.ReadWrite:
+        return None, "not a read-write register"
+    original = register.value
+    mask = _fields_mask(register)
+    try:
+        for bit in range(mask.bit_length()):
+            if not (mask >> bit) & 1:
+                continue
+            register.value = 1 << bit
+            register.invalidate()
+            value = register.value & mask
+            if value != 1 << bit:
+                return False, f"wrote {1 << bit:#010x}, read back {value:#010x}"
+    finally:
+        register.value = original
+    return True, ""
+
+
+def check_access(register: Register) -> tuple[bool | None, str]:
+    if register.access == AccessType.WriteOnly:
+        return None, "write-only register"
+    mask = _fields_mask(register)
+    original = register.value
+    pattern = ~original & mask
+    try:
+        register.value = (original & ~mask) | pattern
+        register.invalidate()
+        value = register.value & mask
+    finally:
+        if register.access == AccessType.ReadWrite:
+            register.value = original
+    if register.access == AccessType.ReadOnly and value != original & mask:
+        return False, f"read-only register changed to {value:#010x} after write"
+    if register.access == AccessType.ReadWrite and value != pattern:
+        return False, f"wrote {pattern:#010x}, read back {value:#010x}"
+    return True, ""
+
+
+def _name(check: Callable[..., Any]) -> str:
+    target = check if hasattr(check, "__name__") else getattr(check, "func", check)
+    name: str = getattr(target, "__name__", type(check).__name__)
+    return name.lstrip("_")
+
+
+def _run(register: Register, path: RegisterPath, checks: tuple[Check, ...], lock: Any) -> list[SweepResult]:
+    results = []
+    for check in checks:
+        try:
+            with lock:
+                passed, detail = check(register)
+        except Exception as error:
+            passed, detail = False, f"{type(error).__name__}: {error}"
+        results.append(SweepResult(path, register.address, _name(check), passed, detail))
+    return results
+
+
+_process_groups: dict[tuple[type[Group], Callable[[], Backend]], Group] = {}
+
+
+def _run_in_process(
+    group_type: type[Group], backend_factory: Callable[[], Backend], path: RegisterPath, checks: tuple[Check, ...]
+) -> list[SweepResult]:
+    key = (group_type, backend_factory)
+    group = _process_groups.get(key)
+    if group is None:
+        group = _process_groups[key] = group_type()
+        group.attach(backend_factory())
+    return _run(group._resolve(path), path, checks, nullcontext())
+
+
+def sweep(
+    group: Group,
+    *checks: Check,
+    workers: int = 4,
+    limit: int | None = None,
+    processes: bool = False,
+    backend_factory: Callable[[], Backend] | None = None,
+) -> Iterator[SweepResult]:
+    if processes and backend_factory is None:
+        raise ValueError("A picklable backend_factory is required to sweep in worker processes")
+    entries = sorted(group._walk(), key=lambda x: x[1])
+    window = workers if limit is None or not processes else min(workers, limit)
+    locks: dict[int, Any] = {}
+    executor: Executor = ProcessPoolExecutor(workers) if processes else ThreadPoolExecutor(workers)
+    pending: set[Future[list[SweepResult]]] = set()
+    try:
+        for path, _, _ in entries:
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                yield from (result for future in done for result in future.result())
+            if processes and backend_factory is not None:
+                pending.add(executor.submit(_run_in_process, type(group), backend_factory, path, checks))
+                continue
+            register = group._resolve(path)
+            key = id(register.backend)
+            if key not in locks:
+                locks[key] = nullcontext() if limit is None else threading.BoundedSemaphore(limit)
+            pending.add(executor.submit(_run, register, path, checks, locks[key]))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from (result for future in done for result in future.result())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import mmap
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import Any, BinaryIO, NamedTuple
+
+from .backend import Backend
+from .group import Group, RegisterPath
+from .index import AddressIndex
+from .register import Register
+
+_MAGIC = b"DRTR"
+_VERSION = 1
+_HEADER = Struct("<4sHH24x")
+_RECORD = Struct("<QQQII")
+
+_READ = 0
+_WRITE = 1
+_PATH = 2
+_NO_PATH = 0xFFFFFFFF
+
+
+class TraceRecord(NamedTuple):
+    timestamp: int
+    address: int
+    value: int
+    write: bool
+    path: str | None
+
+
+def _path_name(group: Group, path: RegisterPath) -> str:
+    parts = []
+    node: Any = group
+    for position in range(0, len(path) - 1, 2):
+        parts.append(f"{node._name}[{path[position]}]" if node._size > 1 else node._name)
+        node = node._children[path[position + 1]]
+    parts.append(node._name)
+    return ".".join(parts)
+
+
+class TraceRecorder(Backend):
+    def __init__(self, backend: Backend, path: str | Path, buffer_size: int = 1 << 20) -> None:
+        self._backend = backend
+        self._width = backend.width
+        self._path = Path(path)
+        self._file: BinaryIO = open(self._path, "wb")  # noqa: SIM115 - owned by the recorder until close()
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, backend.width))
+        self._buffer = bytearray()
+        self._buffer_size = buffer_size
+        self._paths: dict[int, int] = {}
+        self._names: dict[str, int] = {}
+
+    def __enter__(self) -> TraceRecorder:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    @property
+    def backend(self) -> Backend:
+        return self._backend
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def track(self, target: Register | Group) -> None:
+        if isinstance(target, Group):
+            entries = [(address, _path_name(target, path)) for path, address, _ in target._walk()]
+        else:
+            entries = [(target.address, target.name)]
+        for address, name in entries:
+            path_id = self._names.get(name)
+            if path_id is None:
+                path_id = self._names[name] = len(self._names)
+                data = name.encode()
+                padding = -len(data) % _RECORD.size
+                self._buffer += _RECORD.pack(0, path_id, len(data), _PATH, 0) + data + bytes(padding)
+            self._paths[address] = path_id
+
+    def _record(self, op: int, address: int, value: int) -> None:
+        self._buffer += _RECORD.pack(time.time_ns(), address, value, op, self._paths.get(address, _NO_PATH))
+        if len(self._buffer) >= self._buffer_size:
+            self.sync()
+
+    def read(self, address: int) -> int:
+        value = self._backend.read(address)
+        self._record(_READ, address, value)
+        return value
+
+    def write(self, address: int, value: int) -> None:
+        self._record(_WRITE, address, value)
+        self._backend.write(address, value)
+
+    def read_block(self, address: int, count: int) -> list[int]:
+        values = self._backend.read_block(address, count)
+        for i, value in enumerate(values):
+            self._record(_READ, address + (i * self._width), value)
+        return values
+
+    def write_block(self, address: int, values: Sequence[int]) -> None:
+        for i, value in enumerate(values):
+            self._record(_WRITE, address + (i * self._width), value)
+        self._backend.write_block(address, values)
+
+    def read_many(self, addresses: Sequence[int]) -> list[int]:
+        values = self._backend.read_many(addresses)
+        for address, value in zip(addresses, values, strict=True):
+            self._record(_READ, address, value)
+        return values
+
+    def bind(self, register: Register) -> None:
+        self._backend.bind(register)
+
+    def invalidate(self, addresses: Iterable[int] | None = None) -> None:
+        self._backend.invalidate(addresses)
+
+    def flush(self, addresses: Iterable[int] | None = None) -> None:
+        self._backend.flush(addresses)
+        self.sync()
+
+    def sync(self) -> None:
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+class TraceReader:
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        with open(self._path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, width = _HEADER.unpack_from(self._mmap)
+        self._width: int = width
+        if magic != _MAGIC or version != _VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported trace file {self._path}")
+        self._paths: dict[int, str] = {}
+
+    def __enter__(self) -> TraceReader:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        return self.records()
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def paths(self) -> dict[int, str]:
+        return dict(self._paths)
+
+    def records(self, lo: int | None = None, hi: int | None = None, target: Register | Group | None = None) -> Iterator[TraceRecord]:
+        addresses = None
+        if target is not None:
+            addresses = {address for _, address, _ in target._walk()} if isinstance(target, Group) else {target.address}
+        data = self._mmap
+        end = len(data) - _RECORD.size
+        position = _HEADER.size
+        unpack = _RECORD.unpack_from
+        while position <= end:
+            timestamp, address, value, op, path_id = unpack(data, position)
+            position += _RECORD.size
+            if op == _PATH:
+                self._paths[address] = data[position : position + value].decode()
+                position += value + (-value % _RECORD.size)
+                continue
+            if (lo is not None and address < lo) or (hi is not None and address >= hi):
+                continue
+            if addresses is not None and address not in addresses:
+                continue
+            yield TraceRecord(timestamp, address, value, op == _WRITE, self._paths.get(path_id))
+
+    def replay(self, target: Backend | Group | Register, reads: bool = False, lo: int | None = None, hi: int | None = None) -> int:
+        count = 0
+        if isinstance(target, Backend):
+            for record in self.records(lo, hi):
+                if record.write:
+                    target.write(record.address, record.value)
+                elif reads:
+                    target.read(record.address)
+                else:
+                    continue
+                count += 1
+            return count
+        index = AddressIndex(target) if isinstance(target, Group) else None
+        for record in self.records(lo, hi, target):
+            register = target if index is None else index[record.address]
+            if record.write:
+                register.value = record.value  # type: ignore[union-attr]
+            elif reads:
+                register._value = record.value  # type: ignore[union-attr]
+            else:
+                continue
+            count += 1
+        return count
+
+    def close(self) -> None:
+        self._mmap.close()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from types import TracebackType
+from typing import Any
+
+from .backend import Backend
+
+
+class Transaction(Backend):
+    def __init__(self, target: Any) -> None:
+        self._target = target
+        self._backend: Backend | None = None
+        self._active = False
+        self._fetched: dict[int, int] = {}
+        self._pending: dict[int, int] = {}
+
+    def __enter__(self) -> Transaction:
+        backend = self._target.backend
+        if backend is not None and not isinstance(backend, Transaction):
+            self._backend = backend
+            self._width = backend.width
+            self._active = True
+            self._target.attach(self)
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None) -> None:
+        if not self._active:
+            return
+        self._active = False
+        self._target.attach(self._backend)
+        if exc_type is None:
+            self.commit()
+        self._fetched.clear()
+        self._pending.clear()
+
+    @property
+    def pending(self) -> dict[int, int]:
+        return dict(self._pending)
+
+    def read(self, address: int) -> int:
+        if address in self._pending:
+            return self._pending[address]
+        if address not in self._fetched:
+            self._fetched[address] = self._backend.read(address)  # type: ignore[union-attr]
+        return self._fetched[address]
+
+    def write(self, address: int, value: int) -> None:
+        self._pending[address] = value
+
+    def commit(self) -> int:
+        count = 0
+        for address in sorted(self._pending):
+            value = self._pending[address]
+            if self._fetched.get(address) == value:
+                continue
+            self._backend.write(address, value)  # type: ignore[union-attr]
+            self._fetched[address] = value
+            count += 1
+        self._pending.clear()
+        return count
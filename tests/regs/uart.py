@@ -0,0 +1,54 @@
+"""
+D-RAL - Device Register Access Layer
+https://github.com/gembcior/d-ral
+
+MIT License
+
+Copyright (c) 2025 Gembcior
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import dral.model as dral
+
+
+@dral.group("Uart", 0x40001000, 0x00000000, 1)
+class UartGroup(dral.Group):
+    @dral.register("Ctrl", 0x00000000, dral.AccessType.ReadWrite)
+    class CtrlRegister(dral.Register):
+        enableField = dral.Field("Enable", 0, 1)
+        baudField = dral.Field("Baud", 4, 12)
+
+    @dral.register("Status", 0x00000004, dral.AccessType.ReadOnly)
+    class StatusRegister(dral.Register):
+        readyField = dral.Field("Ready", 0, 1)
+        errorField = dral.Field("Error", 1, 1)
+
+    @dral.register("Tx", 0x00000008, dral.AccessType.WriteOnly)
+    class TxRegister(dral.Register):
+        dataField = dral.Field("Data", 0, 8)
+
+    @dral.register("Fifo", 0x0000000C, dral.AccessType.ReadOnly)
+    class FifoRegister(dral.Register):
+        levelField = dral.Field("Level", 0, 8)
+
+    ctrlRegister = CtrlRegister()
+    statusRegister = StatusRegister()
+    txRegister = TxRegister()
+    fifoRegister = FifoRegister()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class TrackingBackend(dral.AsyncMemoryBackend):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def aread(self, address):
+        TrackingBackend.in_flight += 1
+        TrackingBackend.max_in_flight = max(TrackingBackend.max_in_flight, TrackingBackend.in_flight)
+        try:
+            return await super().aread(address)
+        finally:
+            TrackingBackend.in_flight -= 1
+
+
+class TestAsync:
+    def test_register_aread_awrite(self):
+        backend = dral.AsyncMemoryBackend({0x20041060: 0x00000C03})
+        echo = EchoXGroup()
+        echo.attach(backend)
+        bear = echo[1].bearXGroup[2].bearRegister
+
+        async def scenario():
+            assert await bear.aread() == 0x00000C03
+            assert bear.tcpField.value == 0x3
+            bear.tcpField.value = 0x7
+            await bear.awrite()
+            await echo[0].albatrossRegister.awrite(0x80000000)
+
+        asyncio.run(scenario())
+        assert backend.memory == {0x20041060: 0x00000C07, 0x20040000: 0x80000000}
+        assert bear.async_backend is backend
+        assert bear.backend is None
+
+    def test_group_aread_all_overlaps_devices(self):
+        TrackingBackend.in_flight = TrackingBackend.max_in_flight = 0
+        boards = [AlfaGroup(), AlfaGroup()]
+        for i, board in enumerate(boards):
+            board.attach(TrackingBackend({0x20000000: i + 1}, latency=0.01))
+
+        async def scenario():
+            return await asyncio.gather(*(board.aread_all() for board in boards))
+
+        results = asyncio.run(scenario())
+        assert results == [{0x20000000: 0x1, 0x20000020: 0x0}, {0x20000000: 0x2, 0x20000020: 0x0}]
+        assert TrackingBackend.max_in_flight == 4
+        assert boards[1].appleRegister.dpField.value == 0x0
+        assert boards[1].appleRegister.hdmiField.value == 0x0
+        assert boards[0].appleRegister.dpField.value == 0x1
+
+    def test_group_awrite_all_bursts(self):
+        backend = dral.AsyncMemoryBackend()
+        echo = EchoXGroup()
+        echo.attach(backend)
+        echo[0].bearXGroup[1].bearRegister.tcpField.value = 0x5
+        echo[1].albatrossRegister.ecdsaField.value = 0x1
+
+        asyncio.run(echo.awrite_all())
+        assert backend.memory[0x20040040] == 0x5
+        assert backend.memory[0x20041000] == 0x80000000
+        assert len(backend.memory) == 8
+
+    def test_async_and_sync_backends(self):
+        sync_backend = dral.MemoryBackend({0x20000000: 0x1})
+        async_backend = dral.AsyncMemoryBackend({0x20000000: 0x2})
+        alfa = AlfaGroup()
+        alfa.attach(sync_backend)
+        alfa.attach(async_backend)
+
+        assert alfa.appleRegister.value == 0x1
+        assert asyncio.run(alfa.appleRegister.aread()) == 0x2
+
+        alfa.attach(None)
+        assert alfa.appleRegister.backend is None
+        assert alfa.appleRegister.async_backend is None
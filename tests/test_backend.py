@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+from regs.delta_x import DeltaXGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class TestBackend:
+    def test_memory_backend_register_access(self):
+        backend = dral.MemoryBackend()
+        echo = EchoXGroup()
+        echo.attach(backend)
+
+        echo[1].bearXGroup[2].bearRegister.value = 0x55667788
+        assert backend.memory == {0x20041060: 0x55667788}
+
+        backend.write(0x20041060, 0x00000C03)
+        assert echo[1].bearXGroup[2].bearRegister.value == 0x00000C03
+        assert echo[1].bearXGroup[2].bearRegister.tcpField.value == 0x3
+        assert echo[1].bearXGroup[2].bearRegister.udpField.value == 0x3
+
+    def test_memory_backend_field_access(self):
+        backend = dral.MemoryBackend({0x20030000: 0x80000000})
+        delta = DeltaXGroup()
+        delta.attach(backend)
+
+        delta[0].appleRegister.dpField.value = 0x1
+        delta[0].appleRegister.usbField.value = 0x6
+        assert backend.memory[0x20030000] == 0x80030001
+
+        backend.write(0x20030000, 0x4)
+        assert delta[0].appleRegister.hdmiField.value == 0x1
+
+    def test_attach_propagates_to_existing_children(self):
+        backend = dral.MemoryBackend()
+        echo = EchoXGroup()
+        bear = echo[0].bearXGroup[1].bearRegister
+        bear.value = 0x123
+        assert backend.memory == {}
+
+        echo.attach(backend)
+        assert bear.backend is backend
+        assert bear.value == 0x0
+
+        echo.attach(None)
+        bear.value = 0x456
+        assert bear.value == 0x456
+        assert backend.memory == {}
+
+    def test_mmap_backend(self, tmp_path):
+        path = tmp_path / "memory.bin"
+        path.write_bytes(bytes(0x2000))
+        echo = EchoXGroup()
+
+        with dral.MmapBackend(path, base=0x20040000) as backend:
+            echo.attach(backend)
+            assert backend.size == 0x2000
+            echo[1].bearXGroup[1].bearRegister.value = 0x11223344
+            echo[0].albatrossRegister.ecdsaField.value = 0x1
+            backend.flush()
+            assert echo[1].bearXGroup[1].bearRegister.value == 0x11223344
+            with pytest.raises(IndexError):
+                backend.read(0x20042000)
+            with pytest.raises(IndexError):
+                backend.read(0x2003FFFC)
+
+        data = path.read_bytes()
+        assert struct.unpack_from("<I", data, 0x1040)[0] == 0x11223344
+        assert struct.unpack_from("<I", data, 0x0000)[0] == 0x80000000
+
+    def test_mmap_backend_big_endian(self, tmp_path):
+        path = tmp_path / "memory.bin"
+        path.write_bytes(bytes(0x100))
+
+        with dral.MmapBackend(path, width=2, byteorder="big") as backend:
+            backend.write(0x10, 0xABCD)
+            assert backend.read(0x10) == 0xABCD
+
+        assert path.read_bytes()[0x10:0x12] == b"\xab\xcd"
+
+        with pytest.raises(ValueError):
+            dral.MmapBackend(path, width=3)
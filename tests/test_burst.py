@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+from regs.uart import UartGroup
+
+import dral.model as dral
+
+
+class BurstBackend(dral.MemoryBackend):
+    def __init__(self, memory=None):
+        super().__init__(memory)
+        self.calls = []
+
+    def read(self, address):
+        self.calls.append(("read", address, 1))
+        return super().read(address)
+
+    def write(self, address, value):
+        self.calls.append(("write", address, 1))
+        super().write(address, value)
+
+    def read_block(self, address, count):
+        self.calls.append(("read_block", address, count))
+        return [self.memory.get(address + (i * self.width), 0) for i in range(count)]
+
+    def write_block(self, address, values):
+        self.calls.append(("write_block", address, len(values)))
+        for i, value in enumerate(values):
+            self.memory[address + (i * self.width)] = value
+
+
+class TestBurst:
+    def test_read_all_without_gap(self):
+        backend = BurstBackend({0x20040020: 0x3, 0x20041060: 0x401})
+        echo = EchoXGroup()
+        echo.attach(backend)
+
+        values = echo.read_all()
+        assert len(backend.calls) == 8
+        assert all(call[0] == "read" for call in backend.calls)
+        assert values[0x20040020] == 0x3
+        assert echo[0].bearXGroup[0].bearRegister.tcpField._value == 0x3
+        assert echo[1].bearXGroup[2].bearRegister.udpField._value == 0x1
+
+    def test_read_all_with_gap(self):
+        backend = BurstBackend({0x20040000: 0x80000000, 0x20041040: 0x7})
+        echo = EchoXGroup()
+        echo.attach(backend)
+
+        values = echo.read_all(gap=0x1C)
+        assert backend.calls == [("read_block", 0x20040000, 25), ("read_block", 0x20041000, 25)]
+        assert values[0x20040000] == 0x80000000
+        assert values[0x20041040] == 0x7
+        assert echo[1].bearXGroup[1].bearRegister.tcpField._value == 0x7
+        assert echo[0].albatrossRegister.ecdsaField._value == 0x1
+
+    def test_write_all(self, tmp_path):
+        path = tmp_path / "memory.bin"
+        path.write_bytes(bytes(0x100))
+
+        @dral.group("Block", 0x1000, 0, 1)
+        class BlockGroup(dral.Group):
+            @dral.register("Ctrl", 0x0)
+            class CtrlRegister(dral.Register):
+                enableField = dral.Field("Enable", 0, 1)
+
+            @dral.register("Data", 0x4)
+            class DataRegister(dral.Register):
+                dataField = dral.Field("Data", 0, 32)
+
+            @dral.register("Status", 0x10)
+            class StatusRegister(dral.Register):
+                readyField = dral.Field("Ready", 0, 1)
+
+            ctrlRegister = CtrlRegister()
+            dataRegister = DataRegister()
+            statusRegister = StatusRegister()
+
+        block = BlockGroup()
+        block.ctrlRegister.enableField.value = 0x1
+        block.dataRegister.value = 0xCAFEBABE
+        block.statusRegister.readyField.value = 0x1
+
+        with dral.MmapBackend(path, base=0x1000) as mmap_backend:
+            block.attach(mmap_backend)
+            block.write_all()
+            assert mmap_backend.read_block(0x1000, 2) == [0x1, 0xCAFEBABE]
+            assert mmap_backend.read(0x1010) == 0x1
+
+        recording = BurstBackend()
+        block.attach(recording)
+        block.write_all()
+        assert recording.calls == [("write_block", 0x1000, 2), ("write", 0x1010, 1)]
+
+    def test_write_all_skips_read_only(self):
+        backend = BurstBackend()
+        uart = UartGroup()
+        uart.attach(backend)
+        uart.ctrlRegister._value = 0x11
+        uart.statusRegister._value = 0x1
+        uart.txRegister._value = 0x41
+
+        uart.write_all()
+        assert backend.calls == [("write", 0x40001000, 1), ("write", 0x40001008, 1)]
+        assert backend.memory == {0x40001000: 0x11, 0x40001008: 0x41}
+
+    def test_read_all_without_backend(self):
+        alfa = AlfaGroup()
+        alfa.appleRegister.value = 0x1234
+        assert alfa.read_all() == {0x20000000: 0x1234, 0x20000020: 0x0}
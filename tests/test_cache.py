@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from regs.uart import UartGroup
+
+import dral.model as dral
+
+
+class CountingBackend(dral.MemoryBackend):
+    def __init__(self, memory=None):
+        super().__init__(memory)
+        self.reads = 0
+        self.writes = []
+
+    def read(self, address):
+        self.reads += 1
+        return super().read(address)
+
+    def write(self, address, value):
+        self.writes.append((address, value))
+        super().write(address, value)
+
+
+def make_uart(memory=None, **kwargs):
+    backend = CountingBackend(memory)
+    cache = dral.ShadowCache(backend, **kwargs)
+    uart = UartGroup()
+    uart.attach(cache)
+    return uart, cache, backend
+
+
+class TestShadowCache:
+    def test_read_write_register_cached(self):
+        uart, cache, backend = make_uart({0x40001000: 0x11})
+
+        assert uart.ctrlRegister.value == 0x11
+        assert uart.ctrlRegister.enableField.value == 0x1
+        assert uart.ctrlRegister.baudField.value == 0x1
+        assert backend.reads == 1
+        assert (cache.hits, cache.misses) == (2, 1)
+
+        uart.ctrlRegister.baudField.value = 0x20
+        assert backend.writes == [(0x40001000, 0x201)]
+        assert backend.reads == 1
+
+        backend.memory[0x40001000] = 0x0
+        assert uart.ctrlRegister.value == 0x201
+        uart.ctrlRegister.invalidate()
+        assert uart.ctrlRegister.value == 0x0
+        assert backend.reads == 2
+
+    def test_read_only_volatile(self):
+        uart, cache, backend = make_uart({0x40001004: 0x1})
+
+        assert uart.statusRegister.readyField.value == 0x1
+        backend.memory[0x40001004] = 0x0
+        assert uart.statusRegister.readyField.value == 0x0
+        assert backend.reads == 2
+        assert cache.hits == 0
+
+    def test_read_only_wait_until(self):
+        backend = dral.MemoryBackend()
+        uart = UartGroup()
+        uart.attach(dral.ShadowCache(backend))
+
+        assert uart.statusRegister.readyField.value == 0x0
+        backend.memory[0x40001004] = 0x1
+        assert uart.statusRegister.readyField.wait_until(1, timeout=0.1)
+
+    def test_read_only_cacheable(self):
+        uart, cache, backend = make_uart({0x40001004: 0x1}, volatile=False)
+
+        assert uart.statusRegister.readyField.value == 0x1
+        backend.memory[0x40001004] = 0x0
+        assert uart.statusRegister.readyField.value == 0x1
+        uart.invalidate()
+        assert uart.statusRegister.readyField.value == 0x0
+        assert backend.reads == 2
+
+    def test_write_only_tracked(self):
+        uart, cache, backend = make_uart()
+
+        uart.txRegister.value = 0x41
+        uart.txRegister.dataField.value = 0x42
+        assert backend.reads == 0
+        assert backend.writes == [(0x40001008, 0x41), (0x40001008, 0x42)]
+        assert uart.txRegister.value == 0x42
+
+        backend.writes.clear()
+        cache.reapply()
+        assert backend.writes == [(0x40001008, 0x42)]
+        assert backend.reads == 0
+
+    def test_write_back_flush(self):
+        uart, cache, backend = make_uart(write_back=True)
+
+        uart.txRegister.value = 0x41
+        uart.ctrlRegister.enableField.value = 0x1
+        uart.ctrlRegister.baudField.value = 0x3
+        assert backend.writes == []
+        assert cache.dirty == [0x40001000, 0x40001008]
+
+        uart.invalidate()
+        assert uart.ctrlRegister.value == 0x31
+
+        uart.ctrlRegister.flush()
+        assert backend.writes == [(0x40001000, 0x31)]
+        uart.flush()
+        assert backend.writes == [(0x40001000, 0x31), (0x40001008, 0x41)]
+        assert cache.dirty == []
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+np = pytest.importorskip("numpy")
+
+
+class TestColumnarCodec:
+    def test_decode_matches_register(self):
+        bear = EchoXGroup()[0].bearXGroup[0].bearRegister
+        codec = dral.ColumnarCodec(type(bear))
+        samples = np.array([0x0, 0x3, 0x55667788, 0xFFFFFFFF, 0x0007FC01], dtype=np.uint32)
+
+        columns = codec.decode(samples)
+        assert codec.fields == ("tcpField", "udpField")
+        assert columns["tcpField"].dtype == np.uint16
+        for i, sample in enumerate(samples):
+            bear.value = int(sample)
+            assert columns["tcpField"][i] == bear.tcpField.value
+            assert columns["udpField"][i] == bear.udpField.value
+
+    def test_decode_structured(self):
+        codec = dral.ColumnarCodec(AlfaGroup.AppleRegister)
+        records = codec.decode_structured(np.array([0x80018009, -1], dtype=np.int64))
+        assert records.dtype.names == ("dpField", "hdmiField", "usbField")
+        assert records[0]["dpField"] == 0x1
+        assert records[0]["hdmiField"] == 0x2
+        assert records[0]["usbField"] == 0x3
+        assert records[1]["usbField"] == 0xFFFF
+
+    def test_encode_round_trip(self):
+        codec = dral.ColumnarCodec(AlfaGroup.AppleRegister())
+        samples = np.array([0x12345678, 0x87654321, 0x0, 0xFFFFFFFF], dtype=np.uint32)
+        fields_mask = 0x1 | (0xF << 2) | (0xFFFF << 15)
+
+        assert np.array_equal(codec.encode(codec.decode(samples)), samples & fields_mask)
+        assert np.array_equal(codec.encode(codec.decode_structured(samples), base=samples), samples)
+
+    def test_encode_partial_columns(self):
+        codec = dral.ColumnarCodec(AlfaGroup.AppleRegister)
+        encoded = codec.encode({"hdmiField": [0x1, 0x2, 0x1F]}, base=0x80000000)
+        assert encoded.tolist() == [0x80000004, 0x80000008, 0x8000003C]
+        with pytest.raises(KeyError):
+            codec.encode({"fooField": [0x1]})
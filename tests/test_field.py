@@ -1,3 +1,4 @@
+import pytest
 from regs.alfa import AlfaGroup
 from regs.delta_x import DeltaXGroup
 from regs.echo_x import EchoXGroup
@@ -39,3 +40,33 @@ class TestField:
         delta[0].bananaRegister.value = 0x20002
         assert delta[0].bananaRegister.aesField.value == 0x0
         assert delta[0].bananaRegister.hdcpField.value == 0x2
+
+    def test_field_layout_is_shared(self):
+        first = AlfaGroup()
+        second = AlfaGroup()
+
+        first.appleRegister.dpField.value = 0x1
+
+        assert first.appleRegister.dpField.field is second.appleRegister.dpField.field
+        assert first.appleRegister.dpField.field is type(first.appleRegister).dpField
+        assert second.appleRegister.dpField.value == 0x0
+        assert "dpField" not in vars(first.appleRegister)
+
+    def test_field_is_immutable(self):
+        alfa = AlfaGroup()
+        field = alfa.appleRegister.dpField.field
+
+        with pytest.raises(AttributeError):
+            field._position = 4  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            alfa.appleRegister.dpField = 0x1  # type: ignore[misc]
+
+    def test_field_value_is_register_bits(self):
+        delta = DeltaXGroup()
+        register = delta[0].appleRegister
+
+        register.usbField.value = 0x6
+        register._value |= 0x1
+
+        assert register.dpField.value == 0x1
+        assert register.value == 0x30001
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 from copy import copy, deepcopy
 from inspect import getmembers
 from itertools import product
@@ -93,3 +94,136 @@ class TestGroup:
             assert value != copied_value, f"Original and copied groups should not be the same object: {value} != {copied_value}"
             assert value.name == copied_value.name, f"Name mismatch: {value.name} != {copied_value.name}"
             assert value.address == copied_value.address, f"Address mismatch: {value.address:#010x} != {copied_value.address:#010x}"
+
+    def test_group_lazy_children(self):
+        @dral.group("Dma", 0x40000000, 0x40, 256)
+        class DmaGroup(dral.Group):
+            @dral.group("Channel", 0x00000000, 0x00000000, 1)
+            class ChannelGroup(dral.Group):
+                @dral.register("Control", 0x00000004, dral.AccessType.ReadWrite)
+                class ControlRegister(dral.Register):
+                    enableField = dral.Field("Enable", 0, 1)
+
+                controlRegister = ControlRegister()
+
+            channelGroup = ChannelGroup()
+
+        dma = DmaGroup()
+        assert len(dma._elements) == 0, "No children should be created before first access"
+
+        control = dma[200].channelGroup.controlRegister
+        control.enableField.value = 0x1
+        assert control is dma[200].channelGroup.controlRegister
+        assert control.address == 0x40000000 + (200 * 0x40) + 0x4
+        assert dma[200].channelGroup.controlRegister.value == 0x1
+        assert dma[199].channelGroup.controlRegister.value == 0x0
+        assert len(dma._elements) == 2
+
+        copied = deepcopy(dma)
+        assert copied[200].channelGroup.controlRegister is not control
+        assert copied[200].channelGroup.controlRegister.value == 0x1
+
+    def test_group_clone(self):
+        echo = EchoXGroup()
+        echo[1].bearXGroup[2].bearRegister.tcpField.value = 0x7
+        echo[0].albatrossRegister.value = 0x2
+
+        clone = echo.clone()
+        assert type(clone) is EchoXGroup
+        assert len(clone._elements) == 0, "Clone must not copy any state up front"
+        assert clone.address == echo.address
+
+        bear = clone[1].bearXGroup[2].bearRegister
+        assert bear is not echo[1].bearXGroup[2].bearRegister
+        assert bear.tcpField.value == 0x7
+        bear.tcpField.value = 0x3
+        assert echo[1].bearXGroup[2].bearRegister.tcpField.value == 0x7
+        assert len(clone._elements) == 1
+        assert len(clone[1].bearXGroup._elements) == 1
+
+        echo[0].albatrossRegister.value = 0x4
+        assert clone[0].albatrossRegister.value == 0x2, "Parent writes after cloning must not leak into the clone"
+        nested = clone.clone()
+        assert nested[1].bearXGroup[2].bearRegister.tcpField.value == 0x3
+        assert nested[1].bearXGroup[0].bearRegister.value == 0x0
+        clone[1].bearXGroup[2].bearRegister.value = 0x1
+        assert nested[1].bearXGroup[2].bearRegister.tcpField.value == 0x3
+        assert [register.value for register in clone._registers()] == [0x2, 0, 0, 0, 0, 0, 0, 0x1]
+        clone[0].albatrossRegister.value = 0x0
+        assert clone.clone()[0].albatrossRegister.value == 0x0, "Resetting to the default must override the inherited value"
+
+        alfa = AlfaGroup()
+        alfa.appleRegister.value = 0x1
+        forked = alfa.clone()
+        alfa.appleRegister.value = 0x9
+        alfa.bananaRegister.value = 0x9
+        assert forked.appleRegister.value == 0x1
+        assert forked.bananaRegister.value == 0x0
+        forked.appleRegister.value = 0x5
+        assert alfa.appleRegister.value == 0x9
+
+        apple = alfa.appleRegister
+        fork = alfa.clone()
+        apple.value = 0x7
+        assert alfa.appleRegister is apple, "Cloning must not replace the parent's elements"
+        assert alfa.appleRegister.value == 0x7
+        assert fork.appleRegister.value == 0x9
+        assert fork.clone().clone()._base == {("appleRegister", 0): 0x9, ("bananaRegister", 0): 0x9}
+
+        backend = dral.MemoryBackend()
+        echo.attach(backend)
+        attached = echo.clone()
+        attached[0].albatrossRegister.value = 0x5
+        assert backend.memory[0x20040000] == 0x5
+
+    def test_group_address_map(self):
+        addresses = EchoXGroup.address_map()
+        assert len(addresses) == 8
+        assert addresses[(0, "albatrossRegister")] == 0x20040000
+        assert addresses[(1, "bearXGroup", 2, "bearRegister")] == 0x20041060
+
+        echo = EchoXGroup()
+        assert len(echo._elements) == 0
+        assert addresses == {path: echo._resolve(path).address for path in addresses}
+        nested = echo[1].bearXGroup
+        assert {path: address for path, address, _ in nested._walk()} == {
+            (0, "bearRegister"): 0x20041020,
+            (1, "bearRegister"): 0x20041040,
+            (2, "bearRegister"): 0x20041060,
+        }
+
+    def test_group_view(self):
+        echo = EchoXGroup()
+        view = echo[1].bearXGroup[2]
+        assert isinstance(view, dral.GroupView)
+        assert view.index == 2
+        assert view.address == 0x20041060
+        assert view.bearRegister is echo[1].bearXGroup[2].bearRegister
+        assert echo.address == 0x20040000
+        assert echo[1].address == 0x20041000
+        assert echo.address == 0x20040000, "Indexing must not leave state behind in the group"
+        with pytest.raises(AttributeError):
+            view.bearRegister = None  # type: ignore
+        with pytest.raises(AttributeError):
+            view.fooRegister  # noqa: B018
+
+    def test_group_view_threads(self):
+        echo = EchoXGroup()
+        errors = []
+        barrier = threading.Barrier(8)
+
+        def worker(echo_idx, bear_idx):
+            barrier.wait()
+            expected = 0x20040020 + (bear_idx * 0x20) + (echo_idx * 0x1000)
+            for _ in range(2000):
+                register = echo[echo_idx].bearXGroup[bear_idx].bearRegister
+                if register.address != expected:
+                    errors.append((echo_idx, bear_idx, register.address))
+                    return
+
+        threads = [threading.Thread(target=worker, args=(i % 2, i % 3)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
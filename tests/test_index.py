@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+from regs.alfa import AlfaGroup
+from regs.bravo import BravoGroup
+from regs.charlie import CharlieGroup
+from regs.delta_x import DeltaXGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class TestAddressIndex:
+    def test_index_lookup(self):
+        echo = EchoXGroup()
+        index = dral.AddressIndex(echo)
+
+        assert len(index) == 2 + (2 * 3)
+        assert 0x20041040 in index
+        assert 0x20041044 not in index
+        assert index.path(0x20041040) == (1, "bearXGroup", 1, "bearRegister")
+        assert index[0x20041040] is echo[1].bearXGroup[1].bearRegister
+        assert index[0x20040000] is echo[0].albatrossRegister
+        assert index.get(0x20041044) is None
+        with pytest.raises(KeyError):
+            index[0x20041044]
+
+    def test_index_range(self):
+        echo = EchoXGroup()
+        index = dral.AddressIndex(echo)
+
+        registers = index.range(0x20040020, 0x20041000)
+        assert [x.address for x in registers] == [0x20040020, 0x20040040, 0x20040060]
+        assert index.range(0x20041060, 0x20041060) == []
+        assert [x.address for x in index.range(0, 0xFFFFFFFF)] == sorted(index)
+
+    @pytest.mark.parametrize("group", [AlfaGroup, BravoGroup, CharlieGroup, DeltaXGroup, EchoXGroup])
+    def test_index_matches_register_address(self, group):
+        index = dral.AddressIndex(group())
+        for address in index:
+            assert index[address].address == address
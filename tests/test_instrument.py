@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class TestProfiler:
+    def test_register_counters(self):
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        register = echo[1].bearXGroup[2].bearRegister
+        profiler = dral.Profiler()
+        profiler.instrument(echo)
+
+        assert type(register).__name__ == "InstrumentedBearRegister"
+        assert isinstance(register, EchoXGroup.BearXGroup.BearRegister)
+        register.value = 0x5
+        register.value = 0x5
+        _ = register.value
+        register.tcpField.value = 0x7
+        _ = register.udpField.value
+
+        stats = profiler[register.address]
+        assert stats.name == "Bear"
+        assert stats.reads == 3
+        assert stats.writes == 3
+        assert stats.redundant_writes == 1
+        assert stats.fields == {"Tcp": [0, 1], "Udp": [1, 0]}
+        assert sum(reads for reads, _ in stats.histogram.values()) == 3
+        assert sum(writes for _, writes in stats.histogram.values()) == 3
+        assert stats.mean_read_ns > 0
+        assert len(profiler) == 1
+
+    def test_local_model(self):
+        alfa = AlfaGroup()
+        profiler = dral.Profiler()
+        profiler.instrument(alfa)
+
+        alfa.appleRegister.value = 0x1
+        _ = alfa.appleRegister.value
+        alfa.appleRegister.hdmiField.value = 0x3
+        _ = alfa.bananaRegister.aesField.value
+
+        assert alfa.appleRegister.value == 0xD
+        stats = profiler[alfa.appleRegister.address]
+        assert stats.reads == 3
+        assert stats.writes == 2
+        assert stats.fields == {"Hdmi": [0, 1]}
+        assert profiler[alfa.bananaRegister.address].fields == {"Aes": [1, 0]}
+        profiler.reset()
+        assert stats.fields == {}
+
+    def test_lazy_children(self):
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        profiler = dral.Profiler()
+        profiler.instrument(echo)
+
+        echo[0].albatrossRegister.value = 1
+        echo[1].bearXGroup[0].bearRegister.value = 2
+        echo.bearXGroup.bearRegister.tcpField.value = 3
+        echo.read_all()
+
+        assert 0x20040000 in profiler
+        assert profiler[0x20041020].writes == 1
+        assert profiler[0x20040020].writes == 1
+        assert profiler[0x20040020].fields == {"Tcp": [0, 1]}
+
+    def test_remove(self):
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        register = echo.albatrossRegister
+        profiler = dral.Profiler()
+        profiler.instrument(echo)
+        register.value = 1
+        profiler.remove(echo)
+
+        assert type(register) is EchoXGroup.AlbatrossRegister
+        assert type(register.kvmField) is dral.BoundField
+        assert type(echo) is EchoXGroup
+        register.value = 2
+        echo.bearXGroup.bearRegister.value = 3
+        assert profiler[register.address].writes == 1
+        assert 0x20040020 not in profiler
+        assert register.value == 2
+
+    def test_report(self):
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        profiler = dral.Profiler()
+        profiler.instrument(echo)
+        for i in range(3):
+            echo[1].bearXGroup[i].bearRegister.value = 0
+            for _ in range(i):
+                _ = echo[1].bearXGroup[i].bearRegister.value
+        echo[1].bearXGroup[0].bearRegister.value = 0
+
+        assert [stats.address for stats in profiler.top(2)] == [0x20041060, 0x20041020]
+        assert [stats.address for stats in profiler.top(1, "redundant_writes")] == [0x20041020]
+        report = profiler.report(2).splitlines()
+        assert len(report) == 3
+        assert report[1].startswith("Bear") and "0x20041060" in report[1]
+        profiler.reset()
+        assert profiler[0x20041060].accesses == 0
+        assert profiler.top(1)[0].accesses == 0
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+from regs.delta_x import DeltaXGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+def describe(group):
+    result = []
+    for path, address, template in group._walk():
+        fields = [(attr, field.name, field.position, field.width) for attr, field in zip(template._layout, template._fields, strict=True)]
+        result.append((path, address, template.name, template.access, fields))
+    return result
+
+
+SOURCE = """
+import dral.model as dral
+
+
+@dral.group("Foxtrot", 0x30000000, 0x100, {size})
+class FoxtrotGroup(dral.Group):
+    @dral.register("Ctrl", 0x4, dral.AccessType.WriteOnly)
+    class CtrlRegister(dral.Register):
+        startField = dral.Field("Start", 0, 1)
+
+    ctrlRegister = CtrlRegister()
+"""
+
+
+class TestLayoutCache:
+    def test_layout_roundtrip(self, tmp_path):
+        path = tmp_path / "regs.dral"
+        dral.dump_layout([EchoXGroup, DeltaXGroup()], path)
+
+        with dral.LayoutCache(path) as cache:
+            assert list(cache) == ["EchoXGroup", "DeltaXGroup"]
+            assert "EchoXGroup" in cache
+            assert len(cache) == 2
+            echo = cache.EchoXGroup()
+            assert cache["EchoXGroup"] is cache.EchoXGroup
+            assert describe(echo) == describe(EchoXGroup())
+            assert describe(cache.DeltaXGroup()) == describe(DeltaXGroup())
+            assert len(echo) == 2
+            assert len(echo[1].bearXGroup) == 3
+            assert echo[1].bearXGroup[2].bearRegister.address == EchoXGroup()[1].bearXGroup[2].bearRegister.address
+            with pytest.raises(KeyError):
+                _ = cache["AlfaGroup"]
+            with pytest.raises(AttributeError):
+                _ = cache.AlfaGroup
+
+        backend = dral.MemoryBackend()
+        echo.attach(backend)
+        echo[1].bearXGroup[2].bearRegister.udpField.value = 0x5
+        assert backend.memory == {0x20041060: 0x5 << 10}
+
+    def test_layout_invalid(self, tmp_path):
+        path = tmp_path / "broken.dral"
+        path.write_bytes(b"XXXX" + bytes(40))
+        with pytest.raises(dral.LayoutError):
+            dral.LayoutCache(path)
+
+    def test_load_layout(self, tmp_path, monkeypatch):
+        source = tmp_path / "src" / "foxtrot.py"
+        source.parent.mkdir()
+        source.write_text(SOURCE.format(size=2))
+        monkeypatch.syspath_prepend(str(source.parent))
+        cache_dir = tmp_path / "cache"
+
+        cache = dral.load_layout("foxtrot", cache_dir)
+        assert list(cache) == ["FoxtrotGroup"]
+        assert len(cache.FoxtrotGroup()) == 2
+        assert cache.fresh(source)
+        cache.close()
+
+        sys.modules.pop("foxtrot")
+        cache = dral.load_layout("foxtrot", cache_dir)
+        assert "foxtrot" not in sys.modules
+        assert cache.FoxtrotGroup()[1].ctrlRegister.address == 0x30000104
+        cache.close()
+
+        source.write_text(SOURCE.format(size=3))
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        cache = dral.load_layout("foxtrot", cache_dir)
+        assert cache.fresh(source)
+        assert len(cache.FoxtrotGroup()) == 3
+        assert cache.FoxtrotGroup()[2].ctrlRegister.access == dral.AccessType.WriteOnly
+        cache.close()
+        sys.modules.pop("foxtrot", None)
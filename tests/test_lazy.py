@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+
+import pytest
+
+MODULE = """
+import dral.model as dral
+
+
+@dral.group("{name}", {address:#x}, 0, 1)
+class {name}Group(dral.Group):
+    @dral.register("Ctrl", 0x0)
+    class CtrlRegister(dral.Register):
+        enableField = dral.Field("Enable", 0, 1)
+
+    ctrlRegister = CtrlRegister()
+"""
+
+
+@pytest.fixture
+def package(tmp_path, monkeypatch):
+    names = []
+
+    def make(name, exports):
+        path = tmp_path / name
+        path.mkdir()
+        (path / "alfa.py").write_text(MODULE.format(name="Alfa", address=0x40000000))
+        (path / "bravo.py").write_text(MODULE.format(name="Bravo", address=0x40001000))
+        (path / "__init__.py").write_text(f"import dral.model as dral\n\n__all__ = dral.lazy_package(__name__, {exports!r})\n")
+        names.append(name)
+        return import_module(name)
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield make
+    for key in [x for x in sys.modules if x.split(".")[0] in names]:
+        del sys.modules[key]
+
+
+class TestLazyPackage:
+    def test_lazy_exports(self, package):
+        soc = package("lazy_soc", {"AlfaGroup": ".alfa", "BravoGroup": ".bravo"})
+        assert soc.__all__ == ["AlfaGroup", "BravoGroup"]
+        assert {"AlfaGroup", "BravoGroup", "alfa", "bravo"} <= set(dir(soc))
+        assert "lazy_soc.alfa" not in sys.modules
+
+        alfa = soc.AlfaGroup()
+        assert alfa.ctrlRegister.address == 0x40000000
+        assert "lazy_soc.alfa" in sys.modules
+        assert "lazy_soc.bravo" not in sys.modules
+        assert "AlfaGroup" in vars(soc)
+        assert soc.AlfaGroup is sys.modules["lazy_soc.alfa"].AlfaGroup
+
+        from lazy_soc import BravoGroup
+
+        assert BravoGroup().address == 0x40001000
+        with pytest.raises(AttributeError):
+            _ = soc.CharlieGroup
+
+    def test_lazy_submodules(self, package):
+        soc = package("lazy_mods", None)
+        assert soc.__all__ == ["alfa", "bravo"]
+        assert "lazy_mods.bravo" not in sys.modules
+        assert soc.bravo.BravoGroup().name == "Bravo"
+        assert "lazy_mods.alfa" not in sys.modules
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from copy import deepcopy
+
+import pytest
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class TestPathResolver:
+    def test_lookup(self):
+        echo = EchoXGroup()
+
+        field = echo.lookup("EchoX[1].BearX[2].Bear.Tcp")
+        assert isinstance(field, dral.BoundField)
+        assert field.register is echo[1].bearXGroup[2].bearRegister
+        field.value = 0x7
+        assert echo[1].bearXGroup[2].bearRegister.tcpField.value == 0x7
+
+        assert echo.lookup("EchoX[1].BearX[2].Bear") is echo[1].bearXGroup[2].bearRegister
+        assert echo.lookup("EchoX[0].Albatross") is echo[0].albatrossRegister
+        assert echo.lookup("EchoX[1].BearX") is echo[1].bearXGroup
+        assert echo.lookup("EchoX[1].BearX[2]").address == 0x20041060
+        assert echo.lookup("EchoX") is echo
+
+    def test_lookup_without_index(self):
+        alfa = AlfaGroup()
+
+        assert alfa.lookup("Alfa.Apple.Dp") is not None
+        assert alfa.lookup("Alfa[0].Apple") is alfa.appleRegister
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "Echo[0].Albatross",
+            "EchoX[2].Albatross",
+            "EchoX.Albatross",
+            "EchoX[0].Albatross[0]",
+            "EchoX[0].Albatross.Missing",
+            "EchoX[0].BearX.Bear",
+        ],
+    )
+    def test_lookup_missing(self, path):
+        with pytest.raises(KeyError):
+            EchoXGroup().lookup(path)
+
+    @pytest.mark.parametrize("path", ["EchoX[1]..Bear", "EchoX[x].Albatross", "EchoX[0].BearX[*].Bear"])
+    def test_lookup_invalid(self, path):
+        with pytest.raises(ValueError):
+            EchoXGroup().lookup(path)
+
+    def test_lookup_cache(self):
+        echo = EchoXGroup()
+
+        register = echo.lookup("EchoX[1].BearX[0].Bear")
+        assert echo.lookup("EchoX[1].BearX[0].Bear") is register
+        assert echo._paths().cache_info().hits == 1
+
+        resolver = dral.PathResolver(echo, maxsize=1)
+        resolver.lookup("EchoX[0].Albatross")
+        resolver.lookup("EchoX[1].Albatross")
+        assert resolver.cache_info().currsize == 1
+
+    def test_glob(self):
+        echo = EchoXGroup()
+
+        fields = echo.glob("EchoX[*].BearX[*].Bear.Udp")
+        assert [x.register.address for x in fields] == [0x20040020, 0x20040040, 0x20040060, 0x20041020, 0x20041040, 0x20041060]
+        assert all(x.name == "Udp" for x in fields)
+        bear = echo[1].bearXGroup[2].bearRegister
+        assert echo.glob("EchoX[1].BearX[2].Bear.*") == [bear.tcpField, bear.udpField]
+        assert echo.glob("EchoX[*].Alb*") == [echo[0].albatrossRegister, echo[1].albatrossRegister]
+        assert echo.glob("EchoX[*].Missing") == []
+        assert echo.glob("Other[*].Albatross") == []
+
+    def test_copies_resolve_their_own_elements(self):
+        echo = EchoXGroup()
+        register = echo.lookup("EchoX[0].Albatross")
+
+        assert deepcopy(echo).lookup("EchoX[0].Albatross") is not register
+        assert echo.clone().lookup("EchoX[0].Albatross") is not register
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+from regs.uart import UartGroup
+
+import dral.model as dral
+
+
+class ReadyAfterBackend(dral.MemoryBackend):
+    def __init__(self, ready, polls):
+        super().__init__()
+        self.ready = ready
+        self.polls = polls
+        self.reads = 0
+        self.batches = 0
+
+    def read(self, address):
+        self.reads += 1
+        if self.reads >= self.polls:
+            self.memory[address] = self.ready.get(address, self.memory.get(address, 0))
+        return super().read(address)
+
+    def read_many(self, addresses):
+        self.batches += 1
+        self.reads += 1
+        if self.reads >= self.polls:
+            for address in addresses:
+                self.memory[address] = self.ready.get(address, self.memory.get(address, 0))
+        return [self.memory.get(address, 0) for address in addresses]
+
+
+class TestWaitUntil:
+    def test_field_wait_until(self):
+        uart = UartGroup()
+        backend = ReadyAfterBackend({0x40001004: 0x1}, 5)
+        uart.attach(backend)
+
+        result = uart.statusRegister.readyField.wait_until(1)
+        assert result.values == (1,)
+        assert result.polls == 5
+        assert result.elapsed >= 0
+        assert uart.statusRegister.readyField.wait_until(lambda x: x == 1).polls == 1
+
+    def test_register_wait_until(self):
+        uart = UartGroup()
+        uart.attach(ReadyAfterBackend({0x4000100C: 0x20}, 3))
+
+        result = uart.fifoRegister.wait_until(lambda x: x >= 0x10)
+        assert result.values == (0x20,)
+        assert result.polls == 3
+        assert uart.fifoRegister.levelField._value == 0x20
+
+    def test_wait_timeout(self):
+        uart = UartGroup()
+        uart.attach(dral.MemoryBackend())
+        backoff = dral.Backoff(spin=0, initial=1e-3, maximum=4e-3)
+
+        with pytest.raises(dral.WaitTimeout) as error:
+            uart.statusRegister.readyField.wait_until(1, timeout=0.02, backoff=backoff)
+        assert isinstance(error.value, TimeoutError)
+        assert error.value.result.values == (0,)
+        assert 2 <= error.value.result.polls < 20
+        assert error.value.result.elapsed >= 0.02
+
+    def test_wait_for_batched(self):
+        uart = UartGroup()
+        backend = ReadyAfterBackend({0x40001004: 0x1, 0x4000100C: 0x8}, 4)
+        uart.attach(backend)
+        conditions = (
+            (uart.statusRegister.readyField, 1),
+            (uart.statusRegister.errorField, 0),
+            (uart.fifoRegister.levelField, lambda x: x > 4),
+        )
+
+        result = dral.wait_for(conditions)
+        assert result.values == (1, 0, 8)
+        assert result.polls == 4
+        assert backend.batches == 4
+
+    def test_wait_for_any(self):
+        uart = UartGroup()
+        uart.attach(ReadyAfterBackend({0x4000100C: 0x8}, 2))
+        conditions = ((uart.statusRegister.readyField, 1), (uart.fifoRegister.levelField, 8))
+
+        result = dral.wait_for(conditions, require_all=False)
+        assert result.values == (0, 8)
+        assert result.polls == 2
+
+    def test_wait_local(self):
+        uart = UartGroup()
+        uart.statusRegister.readyField.value = 1
+
+        assert uart.statusRegister.wait_until(0x1).polls == 1
+        with pytest.raises(ValueError):
+            dral.wait_for(())
+        with pytest.raises(ValueError):
+            dral.Backoff(initial=0)
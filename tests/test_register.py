@@ -114,3 +114,21 @@ class TestRegister:
             register.value = new_value
             actual_value = register.value
             assert actual_value == new_value, f"Expected value {new_value:#010x}, got {actual_value:#010x}"
+
+    def test_register_value_pack_unpack(self):
+        apple = AlfaGroup.AppleRegister()
+
+        apple.dpField.value = 0x1
+        apple.hdmiField.value = 0x1F
+        apple.usbField.value = 0xABCD
+        assert apple.value == 0x55E6803D
+
+        apple.value = 0xFFFFFFFF
+        assert apple.dpField.value == 0x1
+        assert apple.hdmiField.value == 0xF
+        assert apple.usbField.value == 0xFFFF
+        assert apple.value == 0xFFFFFFFF
+
+        apple.value = 0x00000002
+        apple.dpField.value = 0x1
+        assert apple.value == 0x00000003, "Bits outside of fields should be preserved"
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+from dral.model.remote import _Connection
+
+
+class BrokenSocket:
+    def __init__(self, sock):
+        self._socket = sock
+
+    def __getattr__(self, attr):
+        return getattr(self._socket, attr)
+
+    def sendall(self, data):
+        raise BrokenPipeError("send failed")
+
+
+@pytest.fixture
+def server():
+    with dral.RemoteServer(dral.MemoryBackend()) as server:
+        yield server
+
+
+class TestRemote:
+    def test_remote_register_access(self, server):
+        echo = EchoXGroup()
+        with dral.RemoteBackend(*server.address) as backend:
+            echo.attach(backend)
+            echo[1].bearXGroup[2].bearRegister.value = 0x55667788
+            echo[0].albatrossRegister.kvmField.value = 0x3
+            assert echo[1].bearXGroup[2].bearRegister.value == 0x55667788
+            assert echo[0].albatrossRegister.value == 0x6
+        assert server.backend.memory == {0x20041060: 0x55667788, 0x20040000: 0x6}
+
+    def test_remote_pipelined_reads(self, server):
+        server.backend.memory.update({0x1000 + (i * 4): i for i in range(256)})
+        with dral.RemoteBackend(*server.address) as backend:
+            assert backend.read_many([0x1000 + (i * 4) for i in range(256)]) == list(range(256))
+            assert backend.read_block(0x1000, 16) == list(range(16))
+            backend.write_block(0x2000, [1, 2, 3])
+            backend.sync()
+            assert backend.read_many([0x2000, 0x2004, 0x2008]) == [1, 2, 3]
+
+    def test_remote_burst_group(self, server):
+        echo = EchoXGroup()
+        server.backend.memory.update({0x20040040: 0x5, 0x20041000: 0x80000000})
+        with dral.RemoteBackend(*server.address) as backend:
+            echo.attach(backend)
+            values = echo.read_all()
+        assert values[0x20040040] == 0x5
+        assert echo[1].albatrossRegister.ecdsaField._value == 0x1
+
+    def test_remote_error(self, tmp_path):
+        path = tmp_path / "memory.bin"
+        path.write_bytes(bytes(0x100))
+        with (
+            dral.MmapBackend(path) as mmap_backend,
+            dral.RemoteServer(mmap_backend) as server,
+            dral.RemoteBackend(*server.address) as backend,
+        ):
+            with pytest.raises(dral.RemoteError, match="IndexError"):
+                backend.read(0x100)
+            backend.write(0x200, 0x1)
+            with pytest.raises(dral.RemoteError):
+                backend.sync()
+            backend.write(0x10, 0x1234)
+            assert backend.read(0x10) == 0x1234
+
+    def test_remote_threads(self, server):
+        errors = []
+
+        def worker(index):
+            try:
+                with dral.RemoteBackend(*server.address, pool_size=2) as backend:
+                    for i in range(100):
+                        address = (index << 16) | (i * 4)
+                        backend.write(address, i)
+                        assert backend.read(address) == i
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+        assert len(server.backend.memory) == 400
+
+    def test_remote_connection_lost(self, server):
+        connection = _Connection(*server.address, timeout=1.0)
+        futures = [connection.submit(0, 0x1000, 1) for _ in range(16)]
+        connection.close()
+
+        for future in futures:
+            assert future.exception(timeout=1.0) is None or isinstance(future.exception(), ConnectionError)
+        assert connection._pending == {}
+        with pytest.raises(ConnectionError):
+            connection.submit(0, 0x1000, 1)
+
+    def test_remote_send_failure(self, server):
+        connection = _Connection(*server.address, timeout=1.0)
+        connection._socket = BrokenSocket(connection._socket)  # type: ignore[assignment]
+
+        with pytest.raises(BrokenPipeError):
+            connection.submit(0, 0x1000, 1)
+        assert connection._pending == {}
+        connection.close()
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import pytest
+from regs.delta_x import DeltaXGroup
+from regs.echo_x import EchoXGroup
+from regs.uart import UartGroup
+
+import dral.model as dral
+
+
+class RecordingBackend(dral.MemoryBackend):
+    def __init__(self, memory=None):
+        super().__init__(memory)
+        self.calls = []
+
+    def read(self, address):
+        self.calls.append(("read", address, 1))
+        return super().read(address)
+
+    def write(self, address, value):
+        self.calls.append(("write", address, 1))
+        super().write(address, value)
+
+
+class TestSnapshot:
+    def test_snapshot_local(self):
+        echo = EchoXGroup()
+        echo[1].bearXGroup[2].bearRegister.tcpField.value = 0x7
+        snapshot = echo.snapshot()
+
+        assert len(snapshot) == 8
+        assert list(snapshot.addresses) == sorted(address for _, address, _ in echo._walk())
+        assert snapshot[0x20041060] == 0x7
+        assert snapshot.as_dict()[0x20040000] == 0
+        with pytest.raises(KeyError):
+            snapshot[0x20041064]
+
+    @pytest.mark.parametrize("chunk", [2, 256])
+    def test_snapshot_diff(self, chunk, monkeypatch):
+        monkeypatch.setattr("dral.model.snapshot._CHUNK", chunk)
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        before = echo.snapshot()
+        echo[1].bearXGroup[2].bearRegister.udpField.value = 0x3
+        echo[0].albatrossRegister.value = 0x80000002
+        after = echo.snapshot()
+
+        assert before.diff(before) == []
+        assert before != after
+        assert before.diff(after) == [
+            dral.Change(0x20040000, "Albatross", 0, 0x80000002, {"Kvm": (0, 1), "Ecdsa": (0, 1)}),
+            dral.Change(0x20041060, "Bear", 0, 0x3 << 10, {"Udp": (0, 3)}),
+        ]
+        assert after.diff(before)[1].fields == {"Udp": (3, 0)}
+        with pytest.raises(ValueError):
+            before.diff(DeltaXGroup().snapshot())
+
+    def test_snapshot_restore(self):
+        echo = EchoXGroup()
+        backend = dral.MemoryBackend()
+        echo.attach(backend)
+        echo[1].bearXGroup[0].bearRegister.value = 0x5
+        snapshot = echo.snapshot()
+        echo[1].bearXGroup[0].bearRegister.value = 0x6
+        echo[0].albatrossRegister.value = 0x2
+
+        echo.restore(snapshot)
+        assert backend.memory[0x20041020] == 0x5
+        assert backend.memory[0x20040000] == 0
+        assert echo.snapshot() == snapshot
+
+        copy = EchoXGroup()
+        copy.restore(snapshot)
+        assert copy[1].bearXGroup[0].bearRegister.tcpField.value == 0x5
+        with pytest.raises(ValueError):
+            DeltaXGroup().restore(snapshot)
+
+    def test_snapshot_access(self):
+        backend = RecordingBackend({0x40001000: 0x11, 0x40001004: 0x1, 0x40001008: 0x41, 0x4000100C: 0x3})
+        uart = UartGroup()
+        uart.attach(backend)
+        snapshot = uart.snapshot()
+        assert snapshot.as_dict() == {0x40001000: 0x11, 0x40001004: 0x1, 0x4000100C: 0x3}
+        assert ("read", 0x40001008, 1) not in backend.calls
+
+        backend.memory[0x40001004] = 0x0
+        backend.calls.clear()
+        uart.restore(snapshot)
+        assert backend.calls == [("write", 0x40001000, 1)]
+        assert backend.memory[0x40001004] == 0x0
+        assert backend.memory[0x40001008] == 0x41
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+import dral.model.svd as svd
+
+
+def describe(group):
+    result = []
+    for path, address, template in group._walk():
+        fields = [(attr, field.name, field.position, field.width) for attr, field in zip(template._layout, template._fields, strict=True)]
+        result.append((path, address, template.name, template.access, fields))
+    return result
+
+
+class UnseekableBytesIO(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+@pytest.fixture(params=["svd", "json"])
+def model(request, datadir):
+    loader = dral.load_svd if request.param == "svd" else dral.load_json
+    return lambda peripherals=None: loader(datadir / f"echo_x.{request.param}", peripherals)
+
+
+class TestSvdLoader:
+    def test_matches_decorators(self, model):
+        groups = model()
+
+        assert list(groups) == ["EchoX", "Uart0", "Uart1"]
+        echo = groups["EchoX"]()
+        assert describe(echo) == describe(EchoXGroup())
+        assert echo.name == "EchoX"
+        assert echo[1].bearXGroup[2].bearRegister.address == 0x20041060
+        assert echo[1].albatrossRegister.ecdsaField.position == 31
+
+    def test_clusters_and_derived(self, model):
+        groups = model()
+        uart = groups["Uart1"]()
+
+        assert [(path, address) for path, address, _ in uart._walk()] == [
+            ((0, "statusRegister"), 0x40002000),
+            ((0, "channelXGroup", 0, "dataRegister"), 0x40002104),
+            ((0, "channelXGroup", 1, "dataRegister"), 0x40002114),
+        ]
+        assert uart.statusRegister.access == dral.AccessType.ReadOnly
+        assert uart[0].channelXGroup[1].dataRegister.access == dral.AccessType.WriteOnly
+        assert uart.channelXGroup.dataRegister.byteField.width == 8
+        assert describe(groups["Uart0"]())[1][2:] == describe(uart)[1][2:]
+
+    def test_selected_peripherals(self, model):
+        groups = model({"Uart1"})
+
+        assert list(groups) == ["Uart1"]
+        assert groups["Uart1"]().address == 0x40002000
+
+    def test_json_streaming(self, datadir, monkeypatch):
+        monkeypatch.setattr(svd, "_CHUNK", 7)
+        groups = dral.load_json(datadir / "echo_x.json")
+        assert describe(groups["EchoX"]()) == describe(EchoXGroup())
+
+        stream = io.StringIO('{"peripherals": [], "access": "read-only"}')
+        assert dral.load_json(stream) == {}
+        with pytest.raises(ValueError):
+            dral.load_json(io.StringIO('{"peripherals": [{"name": "A"'))
+        with pytest.raises(ValueError):
+            dral.load_json(io.StringIO('["peripherals"]'))
+
+    def test_svd_streaming(self, datadir):
+        peripherals = dral.iter_svd(datadir / "echo_x.svd")
+
+        name, _ = next(peripherals)
+        assert name == "EchoX"
+        assert [name for name, _ in peripherals] == ["Uart0", "Uart1"]
+        source = b"<device><peripherals><peripheral derivedFrom='X'><name>A</name></peripheral></peripherals></device>"
+        with pytest.raises(ValueError):
+            dral.load_svd(io.BytesIO(source))
+
+    def test_derived_targets(self, datadir):
+        assert svd._scan(datadir / "echo_x.svd", svd._svd_targets) == {"Uart0"}
+        assert svd._scan(datadir / "echo_x.json", svd._json_targets) == {"Uart0"}
+
+        stream = io.BytesIO((datadir / "echo_x.svd").read_bytes())
+        assert svd._scan(stream, svd._svd_targets) == {"Uart0"}
+        assert stream.tell() == 0
+        assert list(dral.load_svd(stream)) == ["EchoX", "Uart0", "Uart1"]
+
+        stream = UnseekableBytesIO((datadir / "echo_x.svd").read_bytes())
+        assert svd._scan(stream, svd._svd_targets) is None
+        assert list(dral.load_svd(stream)) == ["EchoX", "Uart0", "Uart1"]
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+from regs.uart import UartGroup
+
+import dral.model as dral
+
+
+def make_backend():
+    return dral.MemoryBackend()
+
+
+class AccessBackend(dral.MemoryBackend):
+    def __init__(self, read_only=(), stuck=()):
+        super().__init__()
+        self.read_only = set(read_only)
+        self.stuck = set(stuck)
+
+    def write(self, address, value):
+        if address in self.read_only:
+            return
+        if address in self.stuck:
+            value &= ~0x1
+        super().write(address, value)
+
+
+class SlowBackend(dral.MemoryBackend):
+    def read(self, address):
+        time.sleep(0.0005)
+        return super().read(address)
+
+    def write(self, address, value):
+        time.sleep(0.0005)
+        super().write(address, value)
+
+
+class ConcurrencyBackend(dral.MemoryBackend):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def read(self, address):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.001)
+        with self.lock:
+            self.active -= 1
+        return super().read(address)
+
+
+class TestSweep:
+    def test_sweep_all_registers(self):
+        echo = EchoXGroup()
+        echo.attach(dral.MemoryBackend())
+        checks = (dral.check_reset(), dral.check_walking_ones, dral.check_access)
+        results = list(dral.sweep(echo, *checks, workers=4))
+
+        assert len(results) == 8 * 3
+        assert {result.address for result in results} == {address for _, address, _ in echo._walk()}
+        assert {result.check for result in results} == {"check_reset", "check_walking_ones", "check_access"}
+        assert all(result.passed for result in results)
+        assert all(value == 0 for value in echo.backend.memory.values())
+
+    def test_sweep_failures(self):
+        uart = UartGroup()
+        uart.attach(AccessBackend(stuck=(0x40001000,)))
+        results = {(result.address, result.check): result for result in dral.sweep(uart, dral.check_walking_ones, dral.check_access)}
+
+        assert results[(0x40001000, "check_walking_ones")].passed is False
+        assert "0x00000001" in results[(0x40001000, "check_walking_ones")].detail
+        assert results[(0x40001000, "check_access")].passed is False
+        assert results[(0x40001004, "check_walking_ones")].passed is None
+        assert results[(0x40001004, "check_access")].passed is False
+        assert results[(0x40001008, "check_access")].passed is None
+
+        uart.attach(AccessBackend(read_only=(0x40001004,)))
+        results = {(result.address, result.check): result for result in dral.sweep(uart, dral.check_access)}
+        assert results[(0x40001000, "check_access")].passed is True
+        assert results[(0x40001004, "check_access")].passed is True
+
+    def test_sweep_reset_values(self):
+        uart = UartGroup()
+        uart.attach(dral.MemoryBackend({0x40001000: 0x10, 0x40001004: 0x1}))
+        results = {result.address: result for result in dral.sweep(uart, dral.check_reset({0x40001000: 0x10}))}
+
+        assert results[0x40001000].passed is True
+        assert results[0x40001004].passed is False
+        assert results[0x40001008].passed is None
+
+    def test_sweep_check_exception(self):
+        def broken(register):
+            raise RuntimeError("boom")
+
+        echo = EchoXGroup()
+        results = list(dral.sweep(echo, broken))
+        assert all(result.passed is False and result.detail == "RuntimeError: boom" for result in results)
+
+    def test_sweep_checks_do_not_overlap(self):
+        alfa = AlfaGroup()
+        alfa.attach(SlowBackend())
+        results = list(dral.sweep(alfa, dral.check_walking_ones, dral.check_access, workers=4))
+
+        assert len(results) == 4
+        assert all(result.passed for result in results), [result.detail for result in results if not result.passed]
+
+    def test_sweep_backend_limit(self):
+        echo = EchoXGroup()
+        backend = ConcurrencyBackend()
+        echo.attach(backend)
+        results = list(dral.sweep(echo, dral.check_reset(), dral.check_access, workers=8, limit=2))
+
+        assert len(results) == 16
+        assert 1 <= backend.peak <= 2
+
+    def test_sweep_processes(self):
+        echo = EchoXGroup()
+        results = list(dral.sweep(echo, dral.check_walking_ones, workers=2, processes=True, backend_factory=make_backend))
+
+        assert len(results) == 8
+        assert all(result.passed for result in results)
+        with pytest.raises(ValueError):
+            next(dral.sweep(echo, dral.check_walking_ones, processes=True))
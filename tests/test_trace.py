@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from itertools import pairwise
+
+import pytest
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+def record(path, **kwargs):
+    echo = EchoXGroup()
+    recorder = dral.TraceRecorder(dral.MemoryBackend(), path, **kwargs)
+    recorder.track(echo)
+    echo.attach(recorder)
+    echo[0].albatrossRegister.value = 0x2
+    echo[1].bearXGroup[2].bearRegister.tcpField.value = 0x7
+    echo[1].bearXGroup[0].bearRegister.value = 0x400
+    echo.read_all()
+    return echo, recorder
+
+
+class TestTrace:
+    def test_record_and_read(self, tmp_path):
+        path = tmp_path / "bus.trace"
+        _, recorder = record(path)
+        recorder.close()
+
+        with dral.TraceReader(path) as reader:
+            records = list(reader)
+            assert reader.width == 4
+        assert [(x.address, x.value, x.write) for x in records[:4]] == [
+            (0x20040000, 0x2, True),
+            (0x20041060, 0x0, False),
+            (0x20041060, 0x7, True),
+            (0x20041020, 0x400, True),
+        ]
+        assert records[0].path == "EchoX[0].Albatross"
+        assert records[1].path == "EchoX[1].BearX[2].Bear"
+        assert len(records) == 4 + 8
+        assert all(not x.write for x in records[4:])
+        assert all(a.timestamp <= b.timestamp for a, b in pairwise(records))
+
+    def test_buffering(self, tmp_path):
+        path = tmp_path / "bus.trace"
+        _, recorder = record(path)
+        assert path.stat().st_size <= 32
+        recorder.flush()
+        size = path.stat().st_size
+        assert size > 32 and size % 32 == 0
+        recorder.close()
+
+        _, recorder = record(tmp_path / "small.trace", buffer_size=64)
+        assert (tmp_path / "small.trace").stat().st_size > 32
+        recorder.close()
+
+    def test_filter(self, tmp_path):
+        path = tmp_path / "bus.trace"
+        echo, recorder = record(path)
+        recorder.close()
+
+        with dral.TraceReader(path) as reader:
+            assert {x.address for x in reader.records(0x20041000, 0x20042000)} == {0x20041000, 0x20041020, 0x20041040, 0x20041060}
+            bear = {x.address for x in reader.records(target=echo[1].bearXGroup[2].bearRegister)}
+            assert bear == {0x20041060}
+            assert len(list(reader.records(target=echo))) == 12
+
+    def test_replay(self, tmp_path):
+        path = tmp_path / "bus.trace"
+        echo, recorder = record(path)
+        recorder.close()
+
+        backend = dral.MemoryBackend()
+        with dral.TraceReader(path) as reader:
+            assert reader.replay(backend) == 3
+            assert backend.memory == recorder.backend.memory
+            assert reader.replay(dral.MemoryBackend(), reads=True) == 12
+
+            model = EchoXGroup()
+            assert reader.replay(model) == 3
+            assert model[1].bearXGroup[2].bearRegister.tcpField.value == 0x7
+            assert model[1].bearXGroup[0].bearRegister.udpField.value == 0x1
+            assert reader.replay(model.albatrossRegister, lo=0x20040000, hi=0x20040004) == 1
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / "bad.trace"
+        path.write_bytes(bytes(64))
+        with pytest.raises(ValueError):
+            dral.TraceReader(path)
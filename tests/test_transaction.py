@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pytest
+from regs.alfa import AlfaGroup
+from regs.echo_x import EchoXGroup
+
+import dral.model as dral
+
+
+class RecordingBackend(dral.MemoryBackend):
+    def __init__(self, memory=None):
+        super().__init__(memory)
+        self.reads = []
+        self.writes = []
+
+    def read(self, address):
+        self.reads.append(address)
+        return super().read(address)
+
+    def write(self, address, value):
+        self.writes.append((address, value))
+        super().write(address, value)
+
+
+class TestTransaction:
+    def test_register_transaction_single_write(self):
+        backend = RecordingBackend({0x20000000: 0x80000000})
+        alfa = AlfaGroup()
+        alfa.attach(backend)
+
+        with alfa.appleRegister.transaction():
+            alfa.appleRegister.dpField.value = 0x1
+            alfa.appleRegister.hdmiField.value = 0x2
+            alfa.appleRegister.usbField.value = 0x3
+            assert backend.writes == []
+
+        assert backend.reads == [0x20000000]
+        assert backend.writes == [(0x20000000, 0x80018009)]
+        assert alfa.appleRegister.backend is backend
+
+    def test_group_transaction_address_order(self):
+        backend = RecordingBackend()
+        echo = EchoXGroup()
+        echo.attach(backend)
+
+        with echo.transaction() as transaction:
+            echo[1].bearXGroup[2].bearRegister.value = 0x3
+            echo[0].albatrossRegister.kvmField.value = 0x1
+            echo[1].bearXGroup[0].bearRegister.tcpField.value = 0x1
+            echo[1].bearXGroup[0].bearRegister.udpField.value = 0x1
+            assert transaction.pending == {0x20041060: 0x3, 0x20040000: 0x2, 0x20041020: 0x401}
+
+        assert backend.writes == [(0x20040000, 0x2), (0x20041020, 0x401), (0x20041060, 0x3)]
+
+    def test_transaction_skips_unchanged(self):
+        backend = RecordingBackend({0x20000020: 0x5})
+        alfa = AlfaGroup()
+        alfa.attach(backend)
+
+        with alfa.transaction():
+            alfa.bananaRegister.hdcpField.value = 0x5
+            alfa.appleRegister.dpField.value = 0x0
+
+        assert backend.writes == []
+
+    def test_nested_transaction(self):
+        backend = RecordingBackend()
+        alfa = AlfaGroup()
+        alfa.attach(backend)
+
+        with alfa.transaction():
+            with alfa.appleRegister.transaction():
+                alfa.appleRegister.dpField.value = 0x1
+            alfa.appleRegister.hdmiField.value = 0x1
+            assert backend.writes == []
+
+        assert backend.writes == [(0x20000000, 0x5)]
+
+    def test_transaction_discarded_on_error(self):
+        backend = RecordingBackend()
+        alfa = AlfaGroup()
+        alfa.attach(backend)
+
+        with pytest.raises(RuntimeError), alfa.transaction():
+            alfa.appleRegister.dpField.value = 0x1
+            raise RuntimeError
+
+        assert backend.writes == []
+        assert alfa.appleRegister.value == 0x0
+
+    def test_transaction_without_backend(self):
+        alfa = AlfaGroup()
+        with alfa.transaction():
+            alfa.appleRegister.dpField.value = 0x1
+        assert alfa.appleRegister.value == 0x1